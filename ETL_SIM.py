@@ -1,148 +1,604 @@
-#=======================================================================
-#                        General Documentation
-#
-    # Simulation Driver for I-405 Simulation
-#
-#-----------------------Additional Documentation------------------------
-
-# Modification History:
-# - 19 May 2019: ETL_SIM.py created by Adam Sirkis
-# - 04 June 2019: ETL_SIM.py finalized by Adam Sirkis
-
-# Notes:
-# - Developed for Python 3.x
-
-#=======================================================================
-
-from highway import Highway
-from car import Car
-from bus import Bus
-import random
-import file_saver
-import numpy
-#Price ranges + 1, default from 0
-min_price = 11
-max_price = 11
-
-#number of vehilces in Washignton State divided by the number of buses. Update for year
-vehicles_wa = 2925765
-buses_wa = 23556
-percent_bus = buses_wa / vehicles_wa 
-
-#Number of simulations to run for each time price
-sim_number = 1
-
-#Minutes in a day
-time_range = 24 * 60
-time_step = 1
-
-#Length in miles
-length_highway = 11
-#distance from the start of the highway
-n_exit_loc_array = [5, 7, 8, 9, 10]
-s_exit_loc_array = [1, 2, 3, 5, 6]
-
-enter_loc_array = [5, 7, 8, 9, 10]
-
-#Peak times in minutes
-north_peak_start = 15*60
-north_peak_end = 17*60
-north_peak_arr = []
-south_peak_start = 7*60
-south_peak_end = 9*60
-south_peak_arr = []
-for i in range(24*60):
-    if i < north_peak_start or i > north_peak_end:
-        north_peak_arr.append(0)
-    if i >= north_peak_start and i <= north_peak_end:
-        north_peak_arr.append(1)
-    if i < south_peak_start or i > south_peak_end:
-        south_peak_arr.append(0)
-    if i >= south_peak_start and i <= south_peak_end:
-        south_peak_arr.append(1)
-
-n_speed_g = []
-n_speed_e = []
-s_speed_g = []
-s_speed_etl = []
-
-time_vs_money = numpy.zeros(11)
-for m in range(min_price):
-    for n in range(m, max_price):
-        for c in range(sim_number):
-            north_highway = Highway(length_highway, min_toll=m, max_toll=n, exit_loc_arr=n_exit_loc_array, peak_arr=north_peak_arr)
-            south_highway = Highway(length_highway, min_toll=m, max_toll=n, exit_loc_arr=s_exit_loc_array, peak_arr=south_peak_arr)
-            n_vehicle_list = []
-            print(n_vehicle_list)
-            s_vehicle_list = []
-            #North Highway
-            for t in range(time_range):
-                file_saver.graph_color_gradient(north_highway, t, m, n, 'north')
-                #print(len(n_vehicle_list))
-                n_total_moved_per_step = numpy.zeros((north_highway.num_lns))
-                shift = 0
-                n_vehicle_list.reverse()
-                for i in range(len(n_vehicle_list)):
-                    i -= shift
-                    grids_squares_moved, north_highway, exited = n_vehicle_list[i].move(north_highway, t)
-                    n_total_moved_per_step[n_vehicle_list[i].x-1] += grids_squares_moved
-                    if exited == True or n_vehicle_list[i].y + north_highway.grid_per_mile >= north_highway.length * north_highway.grid_per_mile:
-                        if(north_highway.exits_arr[north_highway.exits_arr.index(n_vehicle_list[i].exit)].count < north_highway.exits_arr[north_highway.exits_arr.index(n_vehicle_list[i].exit)].max):
-                            north_highway.exits_arr[north_highway.exits_arr.index(n_vehicle_list[i].exit)].intake(n_vehicle_list[i])  
-                            north_highway.grid[n_vehicle_list[i].y, n_vehicle_list[i].x, 0] = 0
-                            north_highway.grid[n_vehicle_list[i].y-1, n_vehicle_list[i].x, 0] = 0
-                            if n_vehicle_list[i].y < 109:
-                                north_highway.grid[n_vehicle_list[i].y+1, n_vehicle_list[i].x, 0] = 0
-                            if n_vehicle_list[i].y < 108:
-                                north_highway.grid[n_vehicle_list[i].y-2, n_vehicle_list[i].x, 0] = 0
-                            n_vehicle_list.remove(n_vehicle_list[i])
-
-                            shift += 1
-                n_vehicle_list.reverse()
-                north_highway.gpl_speed = ((north_highway.get_speed(n_total_moved_per_step[1], (1/360.0), 1)) + (north_highway.get_speed(n_total_moved_per_step[2], (1/60.0), 2))) / 2.0
-                north_highway.etl_speed = (north_highway.get_speed(n_total_moved_per_step[0], (1/360.0), 0))    
-                north_highway.set_toll(t)
-                time_vs_money[north_highway.etl_price] += len(n_vehicle_list)
-                n_speed_g.append(north_highway.gpl_speed)
-                n_speed_e.append(north_highway.etl_speed)
-                if t % 5 == 0:
-                    for i in range(len(north_highway.exits_arr)):
-                        north_highway.exits_arr[i].deplete()
-                #chaneg based on anticipated traffic numbers
-                while bool(random.randint(0, 50) <= 30):
-                    if random.randint(0, 1000000) / 1000000.0 <= percent_bus:
-                        enter_number = random.randint(0, len(north_highway.entrance_arr))
-                        n_vehicle_list.append(Bus(3, north_highway.entrance_arr[enter_number - 1].y, 10))
-                    else:
-                        n_vehicle_list.append(Car('North', north_highway.grid_per_mile / 2.0, north_highway.grid_per_mile / 2.0, north_highway, 10))
-                north_highway.gpl_speed = ((north_highway.get_speed(n_total_moved_per_step[1], (1/60.0), 1)) + (north_highway.get_speed(n_total_moved_per_step[2], (1/60.0), 2))) / 2.0
-                north_highway.etl_speed = (north_highway.get_speed(n_total_moved_per_step[0], (1/60.0), 0))    
-                north_highway.set_toll(t)
-                time_vs_money[north_highway.etl_price] += len(n_vehicle_list)
-                n_speed_g.append(north_highway.gpl_speed)
-                n_speed_e.append(north_highway.etl_speed)
-                #South Highway
-                """ for t in range(time_range):          
-                    file_saver.graph_color_gradient(south_highway, t, m, n, 'south')
-                    
-                    s_total_moved_per_step = numpy.zeros((north_highway.width))
-                    for i in reversed(list(s_vehicle_list)):
-                        grids_squares_moved, south_highway, exited = i.move(south_highway, t)                   
-                        s_total_moved_per_step[i.x-1] += grids_squares_moved
-                        if exited == True:                        
-                            if(south_highway.exits_arr[south_highway.exits_arr.index(i.exit)].count < south_highway.exits_arr[south_highway.exits_arr.index(i.exit)].max):
-                                south_highway.exits_arr[south_highway.exits_arr.index(i.exit)].intake(i)  
-                                n_vehicle_list.remove(i)
-                    for i in range(len(south_highway.exits_arr)):
-                        south_highway.exits_arr[i].deplete()    
-                    while bool(random.randint(0, 50) <= 15):
-                        if random.randint(0, 1000000) / 1000000.0 <= percent_bus:
-                            enter_number = random.randint(0, len(south_highway.entrance_arr))
-                            s_vehicle_list.append(Bus(3, north_highway.entrance_arr[enter_number].y, 1))
-                        else:
-                            s_vehicle_list.append(Car('South', south_highway.grid_per_mile / 2.0, south_highway.grid_per_mile / 2.0, south_highway, 1))
-                    south_highway.gpl_speed = ((south_highway.get_speed(s_total_moved_per_step[1], (1/360.0), 1)) + (south_highway.get_speed(s_total_moved_per_step[2], (1/60.0), 2))) / 2.0
-                    south_highway.etl_speed = (south_highway.get_speed(s_total_moved_per_step[0], (1/360.0), 0))     
-                    time_vs_money[south_highway.etl_price] += len(s_vehicle_list)
-                    s_speed_g.append(south_highway.gpl_speed)
-                    s_speed_e.append(nsouth_highway.etl_speed)"""
\ No newline at end of file
+#=======================================================================
+#                        General Documentation
+#
+    # Simulation Driver for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 19 May 2019: ETL_SIM.py created by Adam Sirkis
+# - 04 June 2019: ETL_SIM.py finalized by Adam Sirkis
+
+# Notes:
+# - Developed for Python 3.x
+
+#=======================================================================
+
+from highway import Highway
+from car import Car
+from bus import Bus
+from vehicle_store import VehicleStore
+import etl_decision
+import file_saver
+import numpy
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+import checkpoint
+import seeding
+import arrivals
+import profiling
+import metrics
+#Price ranges + 1, default from 0
+min_price = 11
+max_price = 11
+
+#number of vehilces in Washignton State divided by the number of buses. Update for year
+vehicles_wa = 2925765
+buses_wa = 23556
+percent_bus = buses_wa / vehicles_wa 
+
+#Number of simulations to run for each time price
+sim_number = 1
+
+#'objects' moves a list of Car and Bus objects, 'arrays' uses a VehicleStore
+vehicle_engine = 'objects'
+
+#'png' draws heatmap frames, 'trace' appends the raw occupancy of every
+#frame to occupancy_<replicate>.trace next to the frames of a day (see
+#file_saver.OccupancyTrace to replay it),
+#'none' records no frames
+frame_mode = 'png'
+
+#Heatmap frames: draw every frame_stride-th minute on frame_workers processes
+#(None uses every core, 0 draws in the simulation process), or hold them
+#all until the end of the day when frames_deferred is True
+frame_stride = 1
+frame_workers = None
+frames_deferred = False
+
+#Decide whether a vehicle moves to the ETL from a table of the weighted
+#score of every income share, peak, speed and commuter bucket
+#(etl_decision.DecisionTable) instead of summing the weights every time;
+#the decisions are the same
+decision_table = False
+
+#Keep the ETL decision of every vehicle until the toll or speeds move it
+#into another income share, peak or speed bucket instead of deciding
+#again every time step; the random parts of a decision are then kept
+#too, so the results differ from deciding every step
+decision_cache = False
+
+#Save the whole state of a day every checkpoint_every minutes to a file in
+#checkpoint_folder (None turns checkpoints off); a run that is started
+#again picks the day up from its last checkpoint, and skips the scenarios
+#recorded as finished in sweep_checkpoint
+checkpoint_folder = None
+checkpoint_every = 60
+sweep_checkpoint = 'serial.ckpt'
+
+#Seconds run_corridor waits for a day to finish before checking that the
+#processes stepping its directions are still alive
+worker_poll = 10
+
+#Write the toll, speeds, vehicle counts, ramp queues and throughput of
+#every time step to metrics_<replicate>.cols next to the frames of a day,
+#metrics_batch steps at a time (read them back with metrics.MetricsFile)
+record_metrics = True
+metrics_batch = 240
+
+#Record the density (vehicles per mile), flow (vehicles per hour) and
+#space-mean speed of every lane in every mile at every time step, and
+#save them to segments_<replicate>.npz next to the frames of a day
+#(read them back with metrics.read_segments)
+record_segments = False
+
+#Time every phase of every time step (frames, vehicles, exits, speeds,
+#tolls, ramps, arrivals) and the sub-phases of Car.move, print a summary
+#at the end of each day and write the timings to phases.json next to
+#its frames
+profile_phases = False
+profiling.instrument(Car, 'is_near_etl', 'wants_etl', 'move_to_etl', \
+                     'go_to_exit', 'move_on_etl', 'move_on_gpl')
+profiling.instrument(VehicleStore, '_place_waiting', '_release')
+
+#Minutes in a day
+time_range = 24 * 60
+time_step = 1
+
+#Length in miles
+length_highway = 11
+#distance from the start of the highway
+n_exit_loc_array = [5, 7, 8, 9, 10]
+s_exit_loc_array = [1, 2, 3, 5, 6]
+
+enter_loc_array = [5, 7, 8, 9, 10]
+
+#Peak times in minutes
+north_peak_start = 15*60
+north_peak_end = 17*60
+north_peak_arr = []
+south_peak_start = 7*60
+south_peak_end = 9*60
+south_peak_arr = []
+for i in range(24*60):
+    if i < north_peak_start or i > north_peak_end:
+        north_peak_arr.append(0)
+    if i >= north_peak_start and i <= north_peak_end:
+        north_peak_arr.append(1)
+    if i < south_peak_start or i > south_peak_end:
+        south_peak_arr.append(0)
+    if i >= south_peak_start and i <= south_peak_end:
+        south_peak_arr.append(1)
+
+
+#Settings for each direction: exits, peak times, driver direction and the
+#mean number of vehicles arriving per minute over the day (shaped by the
+#hour of the day and the peak times, see arrivals.demand_profile).
+#Optional 'car_sources' and 'bus_sources' weight the start of the highway
+#and each entrance, by default cars join at the start and buses at the
+#entrances (see arrivals.source_weights)
+corridor = {'north': {'exits': n_exit_loc_array, 'peak': north_peak_arr, \
+                      'driving': 'North', 'arrivals': 1.55}, \
+            'south': {'exits': s_exit_loc_array, 'peak': south_peak_arr, \
+                      'driving': 'South', 'arrivals': 0.46}}
+
+def run_direction(direct, min_toll, max_toll, seed=None, clock=None, sink=None, \
+                  checkpoint_path=None, replicate=0):
+    """
+    Simulate one day of traffic in one direction for a single toll range
+    
+    Method Arguments:
+        - direct : 'north' or 'south', a key of corridor
+        - min_toll : number representing the off-peak toll
+        - max_toll : number representing the peak toll
+        - seed : optional seed, every component of the day (arrivals,
+          driver sampling, lane decisions) gets its own stream from it
+        - clock : optional multiprocessing.Barrier shared with the other
+          directions, waited on at the end of every time step so the
+          directions advance together
+        - sink : optional multiprocessing.Queue the results are put on,
+          as (direct, results, None), or (direct, None, traceback) if the
+          day fails
+        - checkpoint_path : optional file the state of the day is saved to
+          every checkpoint_every minutes; if it already holds a checkpoint
+          the day resumes from it, and it is deleted when the day ends
+        - replicate : number of the repeated run for this toll range
+        
+    Returns:
+        - array of vehicle-minutes spent at each ETL price, and the lists
+          of GPL and ETL speeds for every time step
+    """
+    timer = profiling.PhaseTimer() if profile_phases else profiling.NULL_TIMER
+    timer.start()
+    try:
+        results = _simulate_direction(direct, min_toll, max_toll, seed, clock, \
+                                      checkpoint_path, timer, replicate)
+    except Exception:
+        if sink is None:
+            raise
+        if clock is not None:
+            # let the other directions carry on without this one
+            clock.abort()
+        sink.put((direct, None, traceback.format_exc()))
+        return None
+    finally:
+        timer.stop()
+    if profile_phases:
+        _report_phases(timer, direct, min_toll, max_toll)
+    if sink is not None:
+        sink.put((direct, results, None))
+    return results
+
+def _report_phases(timer, direct, m, n):
+    """
+    Print the phase timings of a day and save them next to its frames
+    """
+    folder = file_saver.output_path(direct, m, n)
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    timer.export(os.path.join(folder, 'phases.json'))
+    print(direct, m, n)
+    print(timer.summary())
+
+def move_vehicles(highway, vehicle_list, t, timer=profiling.NULL_TIMER):
+    """
+    Move every Car and Bus of a list one time step, in order from the
+    back of the list, and take off the road those that reach their exit
+
+    Method Arguments:
+        - highway : the Highway the vehicles drive on
+        - vehicle_list : list of Car and Bus objects, updated in place
+        - t : number representing the time step in the sequence
+        - timer : optional PhaseTimer, charged with the moves as
+          'vehicles' and taking vehicles off the road as 'exits'
+
+    Returns:
+        - array of the squares moved in every lane
+    """
+    total_moved_per_step = numpy.zeros((highway.num_lns))
+    if highway.moved is not None:
+        highway.clear_moves()
+    shift = 0
+    vehicle_list.reverse()
+    for i in range(len(vehicle_list)):
+        i -= shift
+        grids_squares_moved, highway, exited = vehicle_list[i].move(highway, t)
+        total_moved_per_step[vehicle_list[i].x-1] += grids_squares_moved
+        if highway.moved is not None:
+            highway.record_moves(vehicle_list[i].x, vehicle_list[i].y, grids_squares_moved)
+        timer.lap('vehicles')
+        if exited == True or vehicle_list[i].y + highway.grid_per_mile >= highway.length * highway.grid_per_mile:
+            ramp = vehicle_list[i].exit
+            if ramp.intake(vehicle_list[i]):
+                highway.vehicle_exited(vehicle_list[i].x - 1)
+                highway.vacate(vehicle_list[i].y, vehicle_list[i].x)
+                highway.vacate(vehicle_list[i].y-1, vehicle_list[i].x)
+                if vehicle_list[i].y < 109:
+                    highway.vacate(vehicle_list[i].y+1, vehicle_list[i].x)
+                if vehicle_list[i].y < 108:
+                    highway.vacate(vehicle_list[i].y-2, vehicle_list[i].x)
+                vehicle_list.remove(vehicle_list[i])
+
+                shift += 1
+            timer.lap('exits')
+    vehicle_list.reverse()
+    return total_moved_per_step
+
+def schedule_arrivals(highway, settings, streams, bus_share=percent_bus):
+    """
+    Draw every vehicle arriving over a day in one direction
+
+    Method Arguments:
+        - highway : the Highway the vehicles arrive at
+        - settings : entry of corridor for the direction
+        - streams : seeding.Streams of the day, the counts are drawn from
+          'arrivals' and the drivers from 'drivers'
+        - bus_share : share of the arriving vehicles that are buses
+
+    Returns:
+        - arrivals.ArrivalSchedule
+    """
+    demand = arrivals.demand_profile(settings['arrivals'], settings['peak'])
+    car_shares, bus_shares = arrivals.source_weights(highway, \
+        settings.get('car_sources'), settings.get('bus_sources'))
+    return arrivals.schedule_day(demand, settings['driving'], \
+                                 streams['arrivals'], bus_share, car_shares, \
+                                 bus_shares, driver_rng=streams['drivers'])
+
+def arriving_vehicles(highway, schedule, t, driving, streams, table=None, \
+                      cache=False):
+    """
+    Vehicles arriving at the highway in one time step
+
+    Method Arguments:
+        - highway : the Highway the vehicles arrive at
+        - schedule : arrivals.ArrivalSchedule of the day
+        - t : number representing the time step in the sequence
+        - driving : direction of the drivers, 'North' or 'South'
+        - streams : seeding.Streams of the day
+        - table : optional etl_decision.DecisionTable the cars decide from
+        - cache : whether the cars keep their decisions, see Car.wants_etl
+
+    Returns:
+        - list of new Car and Bus objects
+    """
+    car_sources, bus_sources, first_car, first_bus = schedule.at(t)
+    vehicles = []
+    for i, source in enumerate(car_sources):
+        car = Car(driving, highway.grid_per_mile / 2.0, highway.grid_per_mile / 2.0, highway, 10, \
+                  profile=schedule.drivers.profile(first_car + i), \
+                  rng=streams['drivers'], decision_rng=streams['decisions'], \
+                  decision_table=table, cache_decisions=cache)
+        car.id = first_car + i
+        if source > 0:
+            car.y = int(highway.entrance_arr[source - 1].y)
+        vehicles.append(car)
+    for i, source in enumerate(bus_sources):
+        # a bus fills three squares, so it starts one square further in
+        y = highway.entrance_arr[source - 1].y if source > 0 else 2
+        bus = Bus(3, y, 10)
+        bus.id = first_bus + i
+        vehicles.append(bus)
+    return vehicles
+
+def _metrics_writer(highway, direct, m, n, c, resume_at):
+    """
+    Writer of the per time step metrics of a day, None when they are off
+    """
+    if not record_metrics:
+        return None
+    path = os.path.join(file_saver.output_path(direct, m, n), \
+                        'metrics_' + str(c) + '.cols')
+    return metrics.MetricsWriter(metrics.day_columns(highway), path, \
+                                 metrics_batch, resume_at)
+
+def _simulate_direction(direct, m, n, seed, clock, checkpoint_path=None, \
+                        timer=profiling.NULL_TIMER, replicate=0):
+    """
+    Body of run_direction
+    """
+    settings = corridor[direct]
+    scenario = (direct, m, n, seed, vehicle_engine)
+    state = None
+    if checkpoint_path is not None:
+        state = checkpoint.load(checkpoint_path)
+    if state is None:
+        streams = seeding.Streams(seed)
+        start = 0
+        time_vs_money = numpy.zeros(11)
+        speed_g = []
+        speed_e = []
+        highway = Highway(length_highway, min_toll=m, max_toll=n, exit_loc_arr=settings['exits'], peak_arr=settings['peak'])
+        schedule = schedule_arrivals(highway, settings, streams)
+        if record_segments:
+            highway.track_segments(time_range)
+        vehicle_list = []
+        table = etl_decision.DecisionTable() if decision_table else None
+        decide = etl_decision.store_decider(rng=streams['decisions'], \
+                                            table=table, cache=decision_cache)
+        store = VehicleStore(highway, 10, highway.grid_per_mile / 2.0, highway.grid_per_mile / 2.0, decide=decide)
+    else:
+        if state['scenario'] != scenario:
+            raise ValueError(checkpoint_path + " holds a checkpoint of " + \
+                             str(state['scenario']) + ", not " + str(scenario))
+        streams = state['streams']
+        start = state['time_step']
+        time_vs_money = state['time_vs_money']
+        speed_g = state['speed_g']
+        speed_e = state['speed_e']
+        highway = state['highway']
+        schedule = state['arrivals']
+        vehicle_list = state['vehicle_list']
+        store = state['store']
+    vehicles = store if vehicle_engine == 'arrays' else vehicle_list
+    # new cars decide as the store does, which a checkpoint keeps
+    table = store.decide.table
+    cache = store.decide.cache
+    if frame_mode == 'trace':
+        frames = file_saver.OccupancyTraceWriter(highway, m, n, direct, frame_stride, resume_at=start, replicate=replicate)
+    elif frame_mode == 'none':
+        frames = None
+    else:
+        frames = file_saver.FrameRenderer(highway, m, n, direct, frame_stride, frame_workers, frames_deferred)
+    records = None
+    try:
+        records = _metrics_writer(highway, direct, m, n, replicate, start)
+        for t in range(start, time_range):
+            timer.begin_step()
+            if frames is not None:
+                frames.capture(highway, t)
+            timer.lap('frames')
+            on_road = len(vehicles)
+            if vehicle_engine == 'arrays':
+                total_moved_per_step, exited_ids = store.step(t)
+                timer.lap('vehicles')
+            else:
+                total_moved_per_step = move_vehicles(highway, vehicle_list, t, timer)
+            # this first estimate has always divided the ETL and the first
+            # GPL lane by a 1/360 hour step
+            lane_speeds = highway.lane_speeds(total_moved_per_step, (1/60.0))
+            short_speeds = highway.lane_speeds(total_moved_per_step, (1/360.0))
+            highway.gpl_speed = (short_speeds[1] + lane_speeds[2]) / 2.0
+            highway.etl_speed = short_speeds[0]
+            if highway.segment_speed is not None:
+                highway.record_segments(t)
+            timer.lap('speeds')
+            highway.set_toll(t)
+            timer.lap('tolls')
+            time_vs_money[highway.etl_price] += len(vehicles)
+            speed_g.append(highway.gpl_speed)
+            speed_e.append(highway.etl_speed)
+            highway.ramps.step(t)
+            timer.lap('ramps')
+            exited = on_road - len(vehicles)
+            on_road = len(vehicles)
+            for vehicle in arriving_vehicles(highway, schedule, t, settings['driving'], streams, table, cache):
+                if vehicle_engine == 'arrays':
+                    store.add_vehicle(vehicle)
+                else:
+                    vehicle_list.append(vehicle)
+                    highway.vehicle_entered(vehicle.x - 1)
+            timer.lap('arrivals')
+            lane_speeds = highway.lane_speeds(total_moved_per_step, (1/60.0))
+            highway.gpl_speed = (lane_speeds[1] + lane_speeds[2]) / 2.0
+            highway.etl_speed = lane_speeds[0]
+            timer.lap('speeds')
+            highway.set_toll(t)
+            timer.lap('tolls')
+            time_vs_money[highway.etl_price] += len(vehicles)
+            speed_g.append(highway.gpl_speed)
+            speed_e.append(highway.etl_speed)
+            if records is not None:
+                records.append(direction=direct, min_toll=m, max_toll=n, \
+                    replicate=replicate, time_step=t, toll=highway.etl_price, \
+                    gpl_speed=highway.gpl_speed, etl_speed=highway.etl_speed, \
+                    lane_speed=lane_speeds, \
+                    lane_vehicles=highway.lane_counts, vehicles=len(vehicles), \
+                    arrived=len(vehicles) - on_road, exited=exited, \
+                    exit_queue=highway.ramps.length[:len(highway.exits_arr)], \
+                    entrance_queue=highway.ramps.length[len(highway.exits_arr):])
+                timer.lap('metrics')
+            if checkpoint_path is not None and (t + 1) % checkpoint_every == 0 \
+               and t + 1 < time_range:
+                if records is not None:
+                    # the file must hold every step before the checkpoint
+                    records.flush()
+                # the store and the vehicles share the highway, so they are
+                # saved in one go to keep those references intact
+                checkpoint.save(checkpoint_path, {'scenario': scenario, \
+                    'time_step': t + 1, 'streams': streams, \
+                    'time_vs_money': time_vs_money, 'speed_g': speed_g, \
+                    'speed_e': speed_e, 'highway': highway, 'arrivals': schedule, \
+                    'vehicle_list': vehicle_list, 'store': store})
+            timer.lap('checkpoints')
+            if clock is not None:
+                try:
+                    clock.wait()
+                except threading.BrokenBarrierError:
+                    # another direction failed, finish the day alone
+                    clock = None
+            timer.lap('waiting')
+            timer.end_step()
+    finally:
+        # a failed day still draws its queued frames and keeps its records
+        try:
+            if frames is not None:
+                frames.close()
+        finally:
+            if records is not None:
+                records.close()
+    if highway.segment_speed is not None:
+        metrics.save_segments(highway, os.path.join( \
+            file_saver.output_path(direct, m, n), \
+            'segments_' + str(replicate) + '.npz'))
+    if checkpoint_path is not None:
+        checkpoint.remove(checkpoint_path)
+    return time_vs_money, speed_g, speed_e
+
+def _checkpoint_path(checkpoint_folder, direct, m, n, c):
+    """
+    Checkpoint file of one direction of a scenario, None without a folder
+    """
+    if checkpoint_folder is None:
+        return None
+    return checkpoint.scenario_path(checkpoint_folder, direct, m, n, c)
+
+def run_scenario(min_toll, max_toll, replicate=0, seed=None, \
+                 checkpoint_folder=None):
+    """
+    Simulate one day of northbound traffic for a single toll range
+    
+    Method Arguments:
+        - min_toll : number representing the off-peak toll
+        - max_toll : number representing the peak toll
+        - replicate : number of the repeated run for this toll range
+        - seed : optional seed for the random number generators
+        - checkpoint_folder : optional folder for checkpoints of the day
+        
+    Returns:
+        - array of vehicle-minutes spent at each ETL price, and the lists
+          of northbound GPL and ETL speeds for every time step
+    """
+    return run_direction('north', min_toll, max_toll, seed, \
+        checkpoint_path=_checkpoint_path(checkpoint_folder, 'north', \
+                                         min_toll, max_toll, replicate), \
+        replicate=replicate)
+
+def direction_seeds(seed, directions):
+    """
+    Derive an independent seed for every direction of a scenario
+    
+    Method Arguments:
+        - seed : seed of the scenario, None leaves the generators unseeded
+        - directions : list of keys of corridor
+    """
+    if seed is None:
+        return {direct: None for direct in directions}
+    return {direct: seeding.derive(seed, direct) for direct in directions}
+
+def run_corridor(min_toll, max_toll, replicate=0, seed=None, \
+                 directions=('north', 'south'), concurrent=True, \
+                 checkpoint_folder=None):
+    """
+    Simulate one day of traffic in both directions for a single toll range
+    
+    Each direction is stepped by its own worker process. The workers
+    share a Barrier as a common clock, so they finish every minute
+    together, and put their results on a shared Queue.
+    
+    Method Arguments:
+        - min_toll : number representing the off-peak toll
+        - max_toll : number representing the peak toll
+        - replicate : number of the repeated run for this toll range
+        - seed : optional seed, split into one seed per direction
+        - directions : keys of corridor to simulate
+        - concurrent : False runs the directions one after the other in
+          this process (always the case inside a daemon process, such as
+          a sweep worker, which cannot start processes of its own)
+        - checkpoint_folder : optional folder for checkpoints of the day
+        
+    Returns:
+        - dict keyed by direction of (time_vs_money, speed_g, speed_e)
+    """
+    seeds = direction_seeds(seed, directions)
+    paths = {direct: _checkpoint_path(checkpoint_folder, direct, min_toll, \
+                                      max_toll, replicate) \
+             for direct in directions}
+    if not concurrent or len(directions) < 2 or \
+       multiprocessing.current_process().daemon:
+        return {direct: run_direction(direct, min_toll, max_toll, seeds[direct], \
+                                      checkpoint_path=paths[direct], \
+                                      replicate=replicate) \
+                for direct in directions}
+    clock = multiprocessing.Barrier(len(directions))
+    sink = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=run_direction, \
+               args=(direct, min_toll, max_toll, seeds[direct], clock, sink, \
+                     paths[direct], replicate)) \
+               for direct in directions]
+    for w in workers:
+        w.start()
+    # drain the queue before joining so no worker blocks on a full pipe
+    results = {}
+    errors = {}
+    while len(results) + len(errors) < len(workers):
+        # a worker found dead before waiting has put anything it reported
+        dead = [(direct, w.exitcode) for direct, w in zip(directions, workers) \
+                if not w.is_alive() and direct not in results and \
+                direct not in errors]
+        try:
+            direct, result, error = sink.get(timeout=worker_poll)
+        except queue.Empty:
+            if not dead:
+                continue
+            # killed without reporting (out of memory, signal), so the
+            # other directions would wait on the clock forever
+            clock.abort()
+            for w in workers:
+                if w.is_alive():
+                    w.terminate()
+                w.join()
+            raise RuntimeError("simulation worker died for " + \
+                               ", ".join(direct + " (exit code " + str(code) + ")" \
+                                         for direct, code in dead))
+        if error is None:
+            results[direct] = result
+        else:
+            errors[direct] = error
+    for w in workers:
+        w.join()
+    if errors:
+        raise RuntimeError("simulation failed for " + \
+                           ", ".join(sorted(errors)) + ":\n" + \
+                           "\n".join(errors.values()))
+    return {direct: results[direct] for direct in directions}
+
+if __name__ == "__main__":
+    scenarios = [(m, n, c) for m in range(min_price) \
+                 for n in range(m, max_price) for c in range(sim_number)]
+    time_vs_money = numpy.zeros(11)
+    done = []
+    progress = None
+    if checkpoint_folder is not None:
+        # finished scenarios and their sum, as sweep.run_sweep keeps them
+        progress = os.path.join(checkpoint_folder, sweep_checkpoint)
+        state = checkpoint.load(progress)
+        if state is not None:
+            if state['scenarios'] != scenarios:
+                raise ValueError(progress + " belongs to a different sweep")
+            time_vs_money = state['time_vs_money']
+            done = state['done']
+    for m, n, c in scenarios:
+        if (m, n, c) in done:
+            continue
+        days = run_corridor(m, n, c, checkpoint_folder=checkpoint_folder)
+        for money, speed_g, speed_e in days.values():
+            time_vs_money += money
+        done.append((m, n, c))
+        if progress is not None:
+            checkpoint.save(progress, {'scenarios': scenarios, \
+                                       'time_vs_money': time_vs_money, \
+                                       'done': done})
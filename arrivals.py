@@ -0,0 +1,154 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Arrival Schedules for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: arrivals.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - The demand of a day is the expected number of vehicles arriving in
+#   every minute: a daily mean rate shaped by the share of the traffic in
+#   every hour and raised in the peak minutes of the direction
+# - The vehicles arriving in every minute at every source (the start of
+#   the highway and each entrance) are Poisson counts of that demand,
+#   drawn for the whole day at once, as are the drivers of every car;
+#   the simulation then only looks up the arrivals of each minute
+
+#=======================================================================
+
+import numpy
+
+import population
+
+#Percent of the daily traffic in every hour of a weekday on an urban
+#freeway, midnight first
+HOURLY_SHARE = [1.0, 0.6, 0.5, 0.5, 0.9, 2.5, 5.0, 6.8, 6.5, 5.3, 5.0, 5.4, \
+                5.6, 5.7, 6.2, 6.8, 7.3, 7.2, 5.8, 4.4, 3.5, 3.0, 2.6, 1.9]
+
+#Demand in the peak minutes of a direction relative to the other
+#minutes of the same hour
+PEAK_FACTOR = 1.5
+
+def demand_profile(rate, peak_arr=(), hourly=HOURLY_SHARE, \
+                   peak_factor=PEAK_FACTOR, minutes=24 * 60):
+    """
+    Expected number of vehicles arriving in every minute of a day
+
+    Method Arguments:
+        - rate : mean vehicles per minute over the day
+        - peak_arr : 1 for the peak minutes of the direction, 0 otherwise
+        - hourly : relative traffic of every hour of the day
+        - peak_factor : extra demand in the peak minutes
+        - minutes : length of the day
+
+    Returns:
+        - float array of vehicles per minute, averaging rate over the day
+    """
+    hourly = numpy.asarray(hourly, dtype=float)
+    hours = numpy.arange(minutes) * len(hourly) // minutes
+    demand = hourly[hours]
+    peak = numpy.zeros(minutes)
+    peak[:min(len(peak_arr), minutes)] = numpy.asarray(peak_arr[:minutes])
+    demand = demand * numpy.where(peak > 0, peak_factor, 1.0)
+    return demand * rate / demand.mean()
+
+def source_weights(highway, car_weights=None, bus_weights=None):
+    """
+    Share of the cars and buses arriving at every source of a highway,
+    source 0 being the start of the highway and source i the entrance
+    highway.entrance_arr[i - 1]
+
+    Method Arguments:
+        - highway : the Highway the vehicles arrive at
+        - car_weights, bus_weights : optional relative weight of every
+          source; by default cars join at the start of the highway and
+          buses at any entrance
+
+    Returns:
+        - (car shares, bus shares), arrays summing to 1
+    """
+    sources = len(highway.entrance_arr) + 1
+    if car_weights is None:
+        car_weights = [1] + [0] * (sources - 1)
+    if bus_weights is None:
+        bus_weights = [0] + [1] * (sources - 1)
+    shares = []
+    for weights in (car_weights, bus_weights):
+        weights = numpy.asarray(weights, dtype=float)
+        if len(weights) != sources:
+            raise ValueError("expected " + str(sources) + \
+                             " source weights, got " + str(len(weights)))
+        shares.append(weights / weights.sum())
+    return shares[0], shares[1]
+
+class ArrivalSchedule(object):
+    """ Every vehicle arriving at a highway over a day
+
+        Data fields:
+            cars:       int array (minutes, sources) of the cars arriving
+                        in every minute at every source
+            buses:      int array (minutes, sources) of the buses
+            drivers:    population.DriverProfiles of every car, in the order
+                        they arrive
+            first_car:  index into drivers of the first car of every minute
+            first_bus:  number of the first bus of every minute, counted on
+                        from the last car so every vehicle of the day has
+                        its own number
+    """
+    def __init__(self, cars, buses, drivers):
+        self.cars = cars
+        self.buses = buses
+        self.drivers = drivers
+        per_minute = cars.sum(axis=1)
+        self.first_car = numpy.concatenate(([0], numpy.cumsum(per_minute)[:-1]))
+        self.first_bus = len(drivers) + \
+            numpy.concatenate(([0], numpy.cumsum(buses.sum(axis=1))[:-1]))
+
+    def __len__(self):
+        return len(self.cars)
+
+    def at(self, time_step):
+        """
+        Arrivals of one minute
+
+        Method Arguments:
+            - time_step : minute of the day
+
+        Returns:
+            - (car sources, bus sources, index of the first driver,
+              number of the first bus), the sources holding one entry per
+              vehicle
+        """
+        sources = numpy.arange(self.cars.shape[1])
+        return numpy.repeat(sources, self.cars[time_step]), \
+               numpy.repeat(sources, self.buses[time_step]), \
+               int(self.first_car[time_step]), int(self.first_bus[time_step])
+
+def schedule_day(demand, driving, rng, bus_share, car_shares, bus_shares, \
+                 driver_rng=None):
+    """
+    Draw the arrivals of a whole day
+
+    Method Arguments:
+        - demand : vehicles per minute, see demand_profile
+        - driving : direction of the drivers, 'North' or 'South'
+        - rng : numpy Generator the arrival counts are drawn from
+        - bus_share : share of the arriving vehicles that are buses
+        - car_shares, bus_shares : share of the cars and buses arriving
+          at every source, see source_weights
+        - driver_rng : numpy Generator the drivers are drawn from,
+          defaults to rng
+
+    Returns:
+        - ArrivalSchedule
+    """
+    demand = numpy.asarray(demand, dtype=float)
+    cars = rng.poisson(numpy.outer(demand * (1 - bus_share), car_shares))
+    buses = rng.poisson(numpy.outer(demand * bus_share, bus_shares))
+    drivers = population.sample_profiles(int(cars.sum()), driving, \
+                                         rng if driver_rng is None else driver_rng)
+    return ArrivalSchedule(cars, buses, drivers)
@@ -0,0 +1,314 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Benchmark Suite for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: benchmark.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - Every workload is seeded, so two runs of the suite do the same work
+#   and their timings can be compared across commits
+# - Results are appended, one JSON record per workload, to a results
+#   file together with the commit they were measured on; compare()
+#   lines up two sets of records and flags the workloads that slowed down
+# - Usage: python benchmark.py [--engine objects|arrays|both]
+#          [--workloads name,...] [--repeat N] [--out FILE] [--compare FILE]
+
+#=======================================================================
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+import numpy
+
+import ETL_SIM
+import file_saver
+import seeding
+from highway import Highway
+from vehicle_store import VehicleStore
+
+RESULTS_FILE = 'benchmarks.jsonl'
+
+#name: (first time step, number of time steps, mean vehicles arriving per
+#minute over the day, bus share, minutes simulated before timing starts)
+WORKLOADS = {'empty_road': (0, 1440, 0.0, 0.0, 0), \
+             'congested_peak': (15 * 60, 120, 3.5, ETL_SIM.percent_bus, 30), \
+             'mixed_bus_car': (7 * 60, 240, 1.55, 0.25, 0), \
+             'full_day_light': (0, 1440, 0.275, ETL_SIM.percent_bus, 0), \
+             'full_day_medium': (0, 1440, 0.7, ETL_SIM.percent_bus, 0), \
+             'full_day_heavy': (0, 1440, 1.55, ETL_SIM.percent_bus, 0)}
+
+#frames drawn by the render workload
+RENDER_FRAMES = 60
+
+ENGINES = ('objects', 'arrays')
+
+def _build(engine, seed, rate, bus_share):
+    """
+    Fresh northbound highway, vehicles, random streams, arrivals and
+    decision table (None unless ETL_SIM.decision_table) for a workload
+    """
+    settings = dict(ETL_SIM.corridor['north'], arrivals=rate)
+    highway = Highway(ETL_SIM.length_highway, min_toll=1, max_toll=5, \
+                      exit_loc_arr=settings['exits'], peak_arr=settings['peak'])
+    streams = seeding.Streams(seed)
+    table = ETL_SIM.etl_decision.DecisionTable() \
+            if ETL_SIM.decision_table else None
+    if engine == 'arrays':
+        vehicles = VehicleStore(highway, 10, highway.grid_per_mile / 2.0, \
+                                highway.grid_per_mile / 2.0, \
+                                decide=ETL_SIM.etl_decision.store_decider( \
+                                    rng=streams['decisions'], table=table, \
+                                    cache=ETL_SIM.decision_cache))
+    else:
+        vehicles = []
+    schedule = ETL_SIM.schedule_arrivals(highway, settings, streams, bus_share)
+    return highway, vehicles, streams, schedule, table
+
+def _add(highway, vehicles, new):
+    """
+    Put newly arrived vehicles on the road of either engine
+    """
+    for vehicle in new:
+        if isinstance(vehicles, VehicleStore):
+            vehicles.add_vehicle(vehicle)
+        else:
+            vehicles.append(vehicle)
+            highway.vehicle_entered(vehicle.x - 1)
+
+def _step(highway, vehicles, t):
+    """
+    One time step of the simulation loop without frames
+
+    Returns:
+        - number of vehicles stepped, whether or not they moved forward
+    """
+    count = len(vehicles)
+    if isinstance(vehicles, VehicleStore):
+        moved, exited = vehicles.step(t)
+    else:
+        moved = ETL_SIM.move_vehicles(highway, vehicles, t)
+    speeds = highway.lane_speeds(moved, 1 / 60.0)
+    highway.gpl_speed = (speeds[1] + speeds[2]) / 2.0
+    highway.etl_speed = speeds[0]
+    highway.set_toll(t)
+    highway.ramps.step(t)
+    return count
+
+def run_workload(name, engine, seed=0):
+    """
+    Run one workload once
+
+    Method Arguments:
+        - name : key of WORKLOADS, or 'render'
+        - engine : 'objects' or 'arrays'
+        - seed : root seed of the workload
+
+    Returns:
+        - (number of time steps, number of vehicle steps, seconds)
+    """
+    if name == 'render':
+        return _render(seed)
+    start, steps, rate, bus_share, warmup = WORKLOADS[name]
+    highway, vehicles, streams, schedule, table = _build(engine, seed, rate, \
+                                                        bus_share)
+    for t in range(start - warmup, start):
+        _step(highway, vehicles, t)
+        _add(highway, vehicles, ETL_SIM.arriving_vehicles(highway, schedule, \
+                                                  t, 'North', streams, table, \
+                                                  ETL_SIM.decision_cache))
+    vehicle_steps = 0
+    began = time.perf_counter()
+    for t in range(start, start + steps):
+        vehicle_steps += _step(highway, vehicles, t)
+        _add(highway, vehicles, ETL_SIM.arriving_vehicles(highway, schedule, \
+                                                  t, 'North', streams, table, \
+                                                  ETL_SIM.decision_cache))
+    return steps, vehicle_steps, time.perf_counter() - began
+
+def _render(seed):
+    """
+    Draw heatmap frames of random occupancy, as FrameRenderer does
+    """
+    rng = numpy.random.default_rng(seed)
+    highway = Highway(ETL_SIM.length_highway, exit_loc_arr=ETL_SIM.n_exit_loc_array)
+    figsize = (highway.num_lns, highway.length * highway.grid_per_mile / 5)
+    shape = numpy.shape(highway.grid[:, 1:-1, 0])
+    frames = [(rng.random(shape) < 0.3).astype('uint8') \
+              for i in range(RENDER_FRAMES)]
+    folder = tempfile.mkdtemp()
+    try:
+        began = time.perf_counter()
+        for i, frame in enumerate(frames):
+            file_saver._render_frame(frame, os.path.join(folder, str(i) + '.png'), \
+                                     figsize)
+        seconds = time.perf_counter() - began
+    finally:
+        shutil.rmtree(folder)
+    return RENDER_FRAMES, 0, seconds
+
+def _peak_memory(name, engine, seed):
+    """
+    Peak bytes allocated by Python while running a workload once
+
+    Measured on a separate run, since tracing allocations slows it down
+    """
+    tracemalloc.start()
+    try:
+        run_workload(name, engine, seed)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def _commit():
+    """
+    Commit the working tree is at, or None outside a git checkout
+    """
+    try:
+        out = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], \
+                                      cwd=os.path.dirname(os.path.abspath(__file__)), \
+                                      stderr=subprocess.DEVNULL)
+        return out.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(names=None, engines=ENGINES, repeat=3, seed=0, memory=True):
+    """
+    Time every workload with every engine
+
+    Method Arguments:
+        - names : workloads to run, None runs all of them and 'render'
+        - engines : engines to run the vehicle workloads with
+        - repeat : number of timed runs, the fastest one is kept
+        - seed : root seed of the workloads
+        - memory : also measure the peak memory of every workload
+
+    Returns:
+        - list of result dicts with steps_per_s, vehicle_steps_per_s and
+          peak_memory_bytes of every (workload, engine)
+    """
+    if names is None:
+        names = list(WORKLOADS) + ['render']
+    meta = {'commit': _commit(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), \
+            'python': platform.python_version(), 'numpy': numpy.__version__, \
+            'machine': platform.machine(), 'seed': seed, 'repeat': repeat, \
+            'decision_table': ETL_SIM.decision_table, \
+            'decision_cache': ETL_SIM.decision_cache}
+    results = []
+    for name in names:
+        for engine in (engines if name != 'render' else ('-',)):
+            best = None
+            for i in range(repeat):
+                steps, vehicle_steps, seconds = run_workload(name, engine, seed)
+                if best is None or seconds < best:
+                    best = seconds
+            record = dict(meta)
+            record.update({'workload': name, 'engine': engine, \
+                           'steps': steps, 'vehicle_steps': vehicle_steps, \
+                           'seconds': best, \
+                           'steps_per_s': steps / best, \
+                           'vehicle_steps_per_s': vehicle_steps / best, \
+                           'peak_memory_bytes': \
+                           _peak_memory(name, engine, seed) if memory else None})
+            results.append(record)
+    return results
+
+def save_results(results, path=RESULTS_FILE):
+    """
+    Append result records to a JSON lines file
+    """
+    with open(path, 'a') as f:
+        for record in results:
+            f.write(json.dumps(record) + '\n')
+
+def load_results(path=RESULTS_FILE, commit=None):
+    """
+    Read result records, keeping the latest run of every (workload, engine)
+
+    Method Arguments:
+        - path : results file written by save_results
+        - commit : only read the records of this commit
+    """
+    latest = {}
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if commit is None or record['commit'] == commit:
+                latest[(record['workload'], record['engine'])] = record
+    return latest
+
+def compare(baseline, results, tolerance=0.10):
+    """
+    Compare results against a baseline
+
+    Method Arguments:
+        - baseline : dict from load_results
+        - results : list from run_suite
+        - tolerance : slow down (as a fraction of steps/s) that counts as
+          a regression
+
+    Returns:
+        - list of (workload, engine, ratio of steps/s, regressed) for the
+          workloads in both, where ratio > 1 is faster than the baseline
+    """
+    rows = []
+    for record in results:
+        key = (record['workload'], record['engine'])
+        if key not in baseline:
+            continue
+        ratio = record['steps_per_s'] / baseline[key]['steps_per_s']
+        rows.append((key[0], key[1], ratio, ratio < 1 - tolerance))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the I-405 simulation")
+    parser.add_argument('--engine', default='both', choices=ENGINES + ('both',))
+    parser.add_argument('--workloads', default=None, \
+                        help="comma separated names, default all")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-memory', action='store_true')
+    parser.add_argument('--decision-table', action='store_true', \
+                        help="decide from etl_decision.DecisionTable")
+    parser.add_argument('--decision-cache', action='store_true', \
+                        help="keep decisions until their bucket changes")
+    parser.add_argument('--out', default=RESULTS_FILE)
+    parser.add_argument('--compare', default=None, \
+                        help="results file to compare against")
+    args = parser.parse_args()
+    ETL_SIM.decision_table = args.decision_table
+    ETL_SIM.decision_cache = args.decision_cache
+    engines = ENGINES if args.engine == 'both' else (args.engine,)
+    names = args.workloads.split(',') if args.workloads else None
+    results = run_suite(names, engines, args.repeat, args.seed, \
+                        not args.no_memory)
+    for r in results:
+        memory = '' if r['peak_memory_bytes'] is None else \
+                 "%10.1f MiB" % (r['peak_memory_bytes'] / 2.0**20)
+        print("%-16s %-8s %10.1f steps/s %12.1f vehicle steps/s%s" % \
+              (r['workload'], r['engine'], r['steps_per_s'], \
+               r['vehicle_steps_per_s'], memory))
+    if args.compare is not None:
+        regressed = False
+        for name, engine, ratio, slow in compare(load_results(args.compare), results):
+            regressed = regressed or slow
+            print("%-16s %-8s %6.2fx%s" % (name, engine, ratio, \
+                                           "  REGRESSION" if slow else ""))
+    save_results(results, args.out)
+    if args.compare is not None and regressed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
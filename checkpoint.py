@@ -0,0 +1,83 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Checkpoint Files for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: checkpoint.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - A checkpoint is a dict of simulation state (highway, vehicles, ramp
+#   counters, random generator states, time step, metrics so far)
+#   pickled and gzip compressed behind a short magic string
+# - Files are written next to their final name and then renamed, so a
+#   run killed while saving leaves the previous checkpoint intact
+
+#=======================================================================
+
+import gzip
+import os
+import pickle
+
+CHECKPOINT_MAGIC = b'I405CKP1'
+
+def scenario_path(folder, direct, min_toll, max_toll, replicate):
+    """
+    File holding the time step checkpoint of one direction of a scenario
+
+    Method Arguments:
+        - folder : folder holding the checkpoints of a run
+        - direct : direction of the highway, 'north' or 'south'
+        - min_toll : minimum toll of the scenario
+        - max_toll : maximum toll of the scenario
+        - replicate : number of the repeated run for this toll range
+    """
+    return os.path.join(folder, "%s_%s_%s_%s.ckpt" % \
+                        (direct, min_toll, max_toll, replicate))
+
+def save(path, state):
+    """
+    Write a checkpoint
+
+    Method Arguments:
+        - path : file to write
+        - state : picklable dict of simulation state
+    """
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    temp = path + '.tmp'
+    with gzip.open(temp, 'wb', compresslevel=6) as f:
+        f.write(CHECKPOINT_MAGIC)
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, path)
+
+def load(path):
+    """
+    Read a checkpoint written by save
+
+    Method Arguments:
+        - path : file to read
+
+    Returns:
+        - the saved dict, or None when there is no checkpoint at path
+    """
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, 'rb') as f:
+        if f.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError(path + " is not a simulation checkpoint")
+        return pickle.load(f)
+
+def remove(path):
+    """
+    Delete a checkpoint once the work it covers is finished
+
+    Method Arguments:
+        - path : file to delete
+    """
+    if os.path.exists(path):
+        os.remove(path)
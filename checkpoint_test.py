@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the checkpoint files.
+
+    Checks the state of a day survives a save and a load, and that a
+    checkpoint is only resumed by the scenario that wrote it.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import gzip
+import os
+import shutil
+import tempfile
+
+import checkpoint
+from fixtures import make_highway
+from vehicle_store import VehicleStore
+
+def test_round_trip():
+    """ A saved highway and store load back equal, still sharing the
+        highway, and the file goes once removed
+
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, 'run', 'north_2_5_0.ckpt')
+        assert checkpoint.load(path) is None
+        hw = make_highway()
+        store = VehicleStore(hw)
+        store.add(2, 10, 100)
+        store.add(3, 20, 100, is_bus=True)
+        store._place_waiting()
+        checkpoint.save(path, {'time_step': 7, 'highway': hw, 'store': store})
+        assert os.listdir(os.path.dirname(path)) == ['north_2_5_0.ckpt']
+        state = checkpoint.load(path)
+        assert state['time_step'] == 7
+        assert state['store'].highway is state['highway']
+        assert (state['highway'].occupancy == hw.occupancy).all()
+        assert list(state['highway'].get_lane_counts()) == [0, 1, 1]
+        assert state['store'].count == 2
+        assert list(state['store'].y[:2]) == [10, 20]
+        # the loaded store keeps driving on the loaded highway
+        state['store'].step(0)
+        assert state['highway'].occupancy.sum() == 5
+        assert (hw.occupancy != state['highway'].occupancy).any()
+        checkpoint.remove(path)
+        assert not os.path.exists(path)
+        checkpoint.remove(path)
+    finally:
+        shutil.rmtree(folder)
+
+def test_other_file():
+    """ Loading a file that is not a checkpoint fails clearly
+
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, 'north_2_5_0.ckpt')
+        with gzip.open(path, 'wb') as f:
+            f.write(b'not a checkpoint')
+        failed = False
+        try:
+            checkpoint.load(path)
+        except ValueError:
+            failed = True
+        assert failed
+    finally:
+        shutil.rmtree(folder)
+
+def test_scenario_mismatch():
+    """ A day does not resume from the checkpoint of another scenario
+
+    """
+    import ETL_SIM
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, 'north_2_5_0.ckpt')
+        scenario = ('north', 3, 5, 1, ETL_SIM.vehicle_engine)
+        checkpoint.save(path, {'scenario': scenario, 'time_step': 60})
+        failed = False
+        try:
+            ETL_SIM.run_direction('north', 2, 5, 1, checkpoint_path=path)
+        except ValueError as error:
+            failed = str(scenario) in str(error)
+        assert failed
+        assert checkpoint.load(path)['scenario'] == scenario
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_other_file()
+    test_scenario_mismatch()
+    print("Checkpoint tests passed")
@@ -1,10 +1,10 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Wed May 22 10:08:43 2019
-
-@author: awsir
-"""
-
-class ETL:
-    def __init__(self):
+# -*- coding: utf-8 -*-
+"""
+Created on Wed May 22 10:08:43 2019
+
+@author: awsir
+"""
+
+class ETL:
+    def __init__(self):
         print("etl")
\ No newline at end of file
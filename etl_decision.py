@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Batched version of Car.want_to_move_to_ETL.
+
+    Scores many drivers against the current toll, time and lane speeds
+    in one call. Every rule matches want_to_move_to_ETL in car.py; the
+    if/elif ladders are replaced by np.searchsorted over the same
+    bucket edges and the random parts of the score come from one draw.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import bisect
+
+import numpy as np
+
+DEFAULT_WEIGHTS = [8, 2, 3, 3, 6, 8]
+
+# share of income the toll takes (percent), largest first, and the score
+# given to a share between each pair of edges
+INC_PROPS = np.array([.03, .02, .01, .008, .007, .006, .005])
+INC_MOVE = np.array([0.0, 0.15, 0.3, 0.45, 0.6, .75, .9, 1.0])
+# how much faster the ETL is than the GPL, and the score for each bucket
+COMPARE_SPEEDS = np.array([0, .15, .3, .45, .6, .75, .9, 1.0])
+# score of each speed bucket, anything above the last edge scores 1.0
+SPEED_SCORES = np.append(COMPARE_SPEEDS, 1.0)
+
+def income_bucket(curr_toll, income):
+    """ Index into INC_MOVE of the share of a driver's income the toll takes
+
+        Parameters:
+            curr_toll: toll price, scalar or array
+            income: driver incomes, scalar or array
+    """
+    inc = np.asarray(curr_toll / np.asarray(income, dtype=float) * 100)
+    edges = INC_PROPS[::-1]
+    # number of edges strictly above the share picks the bucket
+    above = len(edges) - np.searchsorted(edges, inc, side='right')
+    # a share exactly on an edge falls through to the last branch
+    return np.where(np.isin(inc, INC_PROPS), len(INC_MOVE) - 1, above)
+
+def income_score(curr_toll, income):
+    """ Score for the share of a driver's income the toll takes
+
+        Parameters:
+            curr_toll: toll price, scalar or array
+            income: driver incomes, scalar or array
+    """
+    return INC_MOVE[income_bucket(curr_toll, income)]
+
+def speed_bucket(etl_speed, gpl_speed):
+    """ Index into SPEED_SCORES of how much faster the ETL is moving
+
+        Parameters:
+            etl_speed: speed of the ETL, scalar or array
+            gpl_speed: speed of the GPL, scalar or array
+    """
+    gpl_speed = np.where(np.asarray(gpl_speed) == 0, 1, gpl_speed)
+    speed_inc = np.asarray(etl_speed / gpl_speed - 1.0)
+    return np.searchsorted(COMPARE_SPEEDS, speed_inc, side='left')
+
+def speed_score(etl_speed, gpl_speed):
+    """ Score for how much faster the ETL is moving than the GPL
+
+        Parameters:
+            etl_speed: speed of the ETL, scalar or array
+            gpl_speed: speed of the GPL, scalar or array
+    """
+    return SPEED_SCORES[speed_bucket(etl_speed, gpl_speed)]
+
+def peak_for_direction(time, north):
+    """ Whether it is the peak period for the direction of each driver
+
+        Parameters:
+            time: what time it is (hours), scalar or array
+            north: bool array, True for northbound drivers
+    """
+    south_peak = (time > 5) & (time < 9)
+    north_peak = (time > 15) & (time < 19)
+    return np.where(north, north_peak, south_peak)
+
+def decision_key(curr_toll, time, etl_speed, gpl_speed, income, north):
+    """ Number of the (income share, peak, speed) bucket of each driver
+
+        Drivers with the same attributes score the same up to the random
+        parts of the score while their bucket does not change.
+
+        Parameters: see want_to_move_to_etl_batch
+        Returns:
+            int array, one key per driver
+    """
+    inc = income_bucket(curr_toll, income)
+    peak = peak_for_direction(np.asarray(time), north)
+    speed = speed_bucket(etl_speed, gpl_speed)
+    return (inc * 2 + peak) * len(SPEED_SCORES) + speed
+
+_INC_EDGES = list(INC_PROPS[::-1])
+_SPEED_EDGES = list(COMPARE_SPEEDS)
+
+def car_buckets(car, curr_toll, time, etl_speed, gpl_speed):
+    """ (income share, peak, speed) buckets of one Car, as income_bucket,
+        peak_for_direction and speed_bucket give them for arrays
+    """
+    inc = curr_toll / car.income * 100
+    if inc in _INC_EDGES:
+        inc_b = len(INC_MOVE) - 1
+    else:
+        inc_b = len(_INC_EDGES) - bisect.bisect_right(_INC_EDGES, inc)
+    if car.direction == 'North':
+        peak = 15 < time < 19
+    else:
+        peak = car.direction == 'South' and 5 < time < 9
+    if gpl_speed == 0:
+        gpl_speed = 1
+    speed_b = bisect.bisect_left(_SPEED_EDGES, (etl_speed / gpl_speed) - 1.0)
+    return inc_b, int(peak), speed_b
+
+def score_components(curr_toll, time, etl_speed, gpl_speed, income, north, \
+                     freq_commuter, has_gtg, in_a_hurry, rng=None):
+    """ The six parts of the ETL score of many drivers, before weighting
+
+        Parameters: see want_to_move_to_etl_batch
+
+        The random parts are drawn here, so scoring the same components
+        with different weights compares the weights on the same drivers
+        and the same draws.
+
+        Returns:
+            float array of shape (6,) + broadcast shape of the arguments,
+            in the order of the score weights
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    inc = income_score(curr_toll, income)
+    peak = peak_for_direction(np.asarray(time), north)
+    # lunch rush (time > 11 and time < 1) can never happen, so outside the
+    # peak the time score is always 0
+    time_sc = np.where(peak, 1.0, 0.0)
+    speed = speed_score(etl_speed, gpl_speed)
+    shape = np.broadcast(inc, peak, speed, freq_commuter, has_gtg, \
+                         in_a_hurry).shape
+    draws = rng.random((3,) + shape)
+    commuter = np.where(freq_commuter, np.where(peak, 1.0, .5), \
+                        0.5 * draws[0])
+    gtg = np.where(has_gtg, 0.5 + 0.5 * draws[1], 0.0)
+    hurry = np.where(in_a_hurry, 0.7 + 0.3 * draws[2], 0.0)
+    return np.stack(np.broadcast_arrays(inc, time_sc, commuter, gtg, \
+                                        hurry, speed))
+
+def weighted_moves(components, score_weights=DEFAULT_WEIGHTS):
+    """ Whether each driver wants the ETL given its score components
+
+        Parameters:
+            components: array from score_components
+            score_weights: how the scores are weighted, one set of six,
+                           or an array (..., 6) of sets scored at once
+        Returns:
+            bool array, the shape of the weight sets (if several)
+            followed by the shape of the drivers
+    """
+    # weight sets first, then one axis per driver axis
+    w = np.moveaxis(np.asarray(score_weights, dtype=float), -1, 0)
+    w = w.reshape(w.shape + (1,) * (components.ndim - 1))
+    score = w[0]*components[0] + w[1]*components[1] + w[2]*components[2] + \
+            w[3]*components[3] + w[4]*components[4] + w[5]*components[5]
+    # if the score is more than 50% of the total score, car moves
+    return score > np.sum(w, axis=0) / 2
+
+def want_to_move_to_etl_batch(curr_toll, time, etl_speed, gpl_speed, \
+                              income, north, freq_commuter, has_gtg, \
+                              in_a_hurry, score_weights=DEFAULT_WEIGHTS, \
+                              rng=None):
+    """ Decide for many drivers at once whether they want to use the ETL
+
+        Parameters:
+            curr_toll: current toll price of ETL
+            time: what time it is
+            etl_speed: how fast ETL are moving
+            gpl_speed: how fast GPL are moving
+            income, north, freq_commuter, has_gtg, in_a_hurry: driver
+                attributes, one entry per driver
+            score_weights: how the scores are weighted
+            rng: numpy Generator for the random parts of the score
+
+        Every argument may be a scalar or an array; they are broadcast
+        together, so a grid of tolls or speeds can be scored against a
+        population in one call.
+
+        Returns:
+            bool array, True where the driver wants to move to the ETL
+    """
+    components = score_components(curr_toll, time, etl_speed, gpl_speed, \
+                                  income, north, freq_commuter, has_gtg, \
+                                  in_a_hurry, rng)
+    return weighted_moves(components, score_weights)
+
+def cars_want_to_move_to_etl(cars, curr_toll, time, etl_speed, gpl_speed, \
+                             score_weights=DEFAULT_WEIGHTS, rng=None):
+    """ want_to_move_to_etl_batch for a list of Car objects
+
+        Returns:
+            bool array with one entry per car
+    """
+    return want_to_move_to_etl_batch(curr_toll, time, etl_speed, gpl_speed, \
+        np.array([c.income for c in cars], dtype=float), \
+        np.array([c.direction == 'North' for c in cars]), \
+        np.array([c.freq_commuter for c in cars]), \
+        np.array([c.has_gtg for c in cars]), \
+        np.array([c.in_a_hurry for c in cars]), score_weights, rng)
+
+class DecisionTable(object):
+    """ want_to_move_to_etl_batch with the weights summed ahead of time
+
+        Everything in the score but the random parts of the commuter,
+        Good-to-Go! and hurry scores only depends on four buckets: the
+        share of income the toll takes, whether it is the peak of the
+        driver's direction, how much faster the ETL is and whether the
+        driver commutes often. The weighted sum of those parts is kept
+        for every combination, so a decision is one lookup, the weighted
+        random parts, and one comparison. The random parts are drawn
+        exactly as the other versions draw them.
+
+        Data fields:
+            score_weights: how the scores are weighted
+            threshold:     score a driver must beat to move
+            base:          (income bucket, peak, speed bucket, frequent
+                           commuter) weighted score without the random
+                           parts
+    """
+    def __init__(self, score_weights=DEFAULT_WEIGHTS):
+        w = np.asarray(score_weights, dtype=float)
+        self.score_weights = w
+        self.threshold = np.sum(w) / 2
+        inc = INC_MOVE[:, None, None, None]
+        time_sc = np.array([0.0, 1.0])[None, :, None, None]
+        # [peak, frequent commuter], 0 where the score is drawn instead
+        commuter = np.array([[0.0, .5], [0.0, 1.0]])[None, :, None, :]
+        speed = SPEED_SCORES[None, None, :, None]
+        # same order as the full sum, so drivers without random parts
+        # get exactly the same score
+        self.base = w[0]*inc + w[1]*time_sc + w[2]*commuter + w[5]*speed
+        self._rows = self.base.tolist()
+
+    def __call__(self, curr_toll, time, etl_speed, gpl_speed, income, north, \
+                 freq_commuter, has_gtg, in_a_hurry, rng=None):
+        """ Decide for many drivers at once whether they want to use the ETL
+
+            Parameters: see want_to_move_to_etl_batch
+            Returns:
+                bool array, True where the driver wants to move to the ETL
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        inc = income_bucket(curr_toll, income)
+        peak = peak_for_direction(np.asarray(time), north)
+        speed = speed_bucket(etl_speed, gpl_speed)
+        shape = np.broadcast(inc, peak, speed, freq_commuter, has_gtg, \
+                             in_a_hurry).shape
+        draws = rng.random((3,) + shape)
+        w = self.score_weights
+        score = self.base[inc, peak.astype(int), speed, \
+                          np.asarray(freq_commuter).astype(int)]
+        score = score + (w[2]*np.where(freq_commuter, 0.0, 0.5 * draws[0]) + \
+                         w[3]*np.where(has_gtg, 0.5 + 0.5 * draws[1], 0.0) + \
+                         w[4]*np.where(in_a_hurry, 0.7 + 0.3 * draws[2], 0.0))
+        return score > self.threshold
+
+    def car_wants_etl(self, car, curr_toll, time, etl_speed, gpl_speed):
+        """ Car.want_to_move_to_ETL from the table, for one Car
+
+            The random parts come from car.decision_rng in the same order
+            as want_to_move_to_ETL draws them.
+        """
+        inc_b, peak, speed_b = car_buckets(car, curr_toll, time, etl_speed, \
+                                           gpl_speed)
+        score = self._rows[inc_b][peak][speed_b][int(bool(car.freq_commuter))]
+        w = self.score_weights
+        if not car.freq_commuter:
+            score += w[2] * car.decision_rng.uniform(0.0, 0.5)
+        if car.has_gtg:
+            score += w[3] * car.decision_rng.uniform(0.5, 1.0)
+        if car.in_a_hurry:
+            score += w[4] * car.decision_rng.uniform(0.7, 1.0)
+        return score > self.threshold
+
+class StoreDecider(object):
+    """ Decision callback for VehicleStore.step
+
+        Scores the requested vehicles of the store against the toll and
+        speeds currently set on its highway, from a DecisionTable when it
+        has one. With cache, a vehicle keeps its last answer (in
+        store.wants_etl) until its decision_key changes. A class rather
+        than a closure so a store can be pickled together with its random
+        stream.
+    """
+    def __init__(self, score_weights=DEFAULT_WEIGHTS, rng=None, table=None, \
+                 cache=False):
+        self.score_weights = score_weights
+        self.rng = rng
+        self.table = table
+        self.cache = cache
+
+    def __call__(self, store, idx, timestep):
+        if not self.cache:
+            return self._decide(store, idx, timestep)
+        hw = store.highway
+        key = decision_key(hw.etl_price, timestep, hw.etl_speed, \
+                           hw.gpl_speed, store.income[idx], store.north[idx])
+        stale = store.decision_key[idx] != key
+        ask = idx[stale]
+        if len(ask) > 0:
+            store.wants_etl[ask] = self._decide(store, ask, timestep)
+            store.decision_key[ask] = key[stale]
+        return store.wants_etl[idx]
+
+    def _decide(self, store, idx, timestep):
+        hw = store.highway
+        if self.table is not None:
+            return self.table(hw.etl_price, timestep, hw.etl_speed, \
+                hw.gpl_speed, store.income[idx], store.north[idx], \
+                store.freq_commuter[idx], store.has_gtg[idx], \
+                store.in_a_hurry[idx], self.rng)
+        return want_to_move_to_etl_batch(hw.etl_price, timestep, \
+            hw.etl_speed, hw.gpl_speed, store.income[idx], store.north[idx], \
+            store.freq_commuter[idx], store.has_gtg[idx], \
+            store.in_a_hurry[idx], self.score_weights, self.rng)
+
+def store_decider(score_weights=DEFAULT_WEIGHTS, rng=None, table=None, \
+                  cache=False):
+    """ Decision callback for VehicleStore.step, see StoreDecider
+
+    """
+    return StoreDecider(score_weights, rng, table, cache)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the batched ETL decision rules.
+
+    Checks etl_decision.py agrees with Car.want_to_move_to_ETL.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import numpy as N
+
+import etl_decision
+from car import Car
+from highway import Highway
+from vehicle_store import VehicleStore
+
+def test_matches_car():
+    """ Drivers without random score parts get the same answer as Car
+
+    """
+    hw = Highway(11, exit_loc_arr=[5, 7, 8, 9, 10], peak_arr=[0]*1440)
+    car = Car('North', 5, 5, hw, 10)
+    car.freq_commuter = True
+    car.has_gtg = False
+    car.in_a_hurry = False
+    for direction in ['North', 'South']:
+        car.direction = direction
+        for income in [20000, 45000, 80000, 150000]:
+            car.income = income
+            for toll in [0, 1, 2.5, 5, 10]:
+                for time in [0, 6, 12, 16, 20]:
+                    for etl_speed in [20, 30, 45, 60, 90]:
+                        expected = car.want_to_move_to_ETL(toll, time, \
+                                                           etl_speed, 30)
+                        batch = etl_decision.cars_want_to_move_to_etl( \
+                                [car], toll, time, etl_speed, 30)
+                        assert batch[0] == expected
+
+def test_broadcast():
+    """ A toll grid against a population gives one answer per pair
+
+    """
+    rng = N.random.default_rng(0)
+    tolls = N.arange(0, 10, 0.5)[:, None]
+    n = 1000
+    out = etl_decision.want_to_move_to_etl_batch(tolls, 16, 40, 25, \
+            rng.integers(20000, 200000, n), N.ones(n, dtype=bool), \
+            rng.random(n) < .8, rng.random(n) < .5, rng.random(n) < .16, \
+            rng=rng)
+    assert out.shape == (len(tolls), n)
+    # higher tolls never make the ETL more popular overall
+    share = out.mean(axis=1)
+    assert share[0] >= share[-1]
+
+def test_weight_sets():
+    """ Several sets of weights scored on the same components agree with
+        scoring each set on its own with the same draws
+
+    """
+    rng = N.random.default_rng(1)
+    n = 500
+    drivers = (rng.integers(20000, 200000, n), rng.random(n) < .5, \
+               rng.random(n) < .8, rng.random(n) < .5, rng.random(n) < .16)
+    weights = N.array([[8, 2, 3, 3, 6, 8], [9, 4, 2, 2, 5, 7]])
+    comps = etl_decision.score_components(5, 16, 40, 25, *drivers, \
+                                          rng=N.random.default_rng(2))
+    both = etl_decision.weighted_moves(comps, weights)
+    assert both.shape == (2, n)
+    for w, moves in zip(weights, both):
+        one = etl_decision.want_to_move_to_etl_batch(5, 16, 40, 25, \
+                  *drivers, score_weights=w, rng=N.random.default_rng(2))
+        assert (one == moves).all()
+
+def test_decision_table():
+    """ The table decides as the full score does, drawing the same
+        random numbers
+
+    """
+    rng = N.random.default_rng(3)
+    n = 2000
+    drivers = (rng.integers(20000, 200000, n), rng.random(n) < .5, \
+               rng.random(n) < .8, rng.random(n) < .5, rng.random(n) < .16)
+    table = etl_decision.DecisionTable()
+    for toll, time, etl_speed in [(0, 6, 25), (1.25, 16, 40), (5, 7, 70)]:
+        full = etl_decision.want_to_move_to_etl_batch(toll, time, etl_speed, \
+                   30, *drivers, rng=N.random.default_rng(4))
+        assert (table(toll, time, etl_speed, 30, *drivers, \
+                      rng=N.random.default_rng(4)) == full).all()
+    hw = Highway(11, exit_loc_arr=[5, 7, 8, 9, 10], peak_arr=[0]*1440)
+    for seed in range(20):
+        car = Car('South' if seed % 2 else 'North', 5, 5, hw, 10, \
+                  rng=N.random.default_rng(seed))
+        for toll, time in [(0.5, 6), (5, 16), (2.5, 12)]:
+            car.decision_rng = N.random.default_rng(seed)
+            expected = car.want_to_move_to_ETL(toll, time, 45, 30)
+            car.decision_rng = N.random.default_rng(seed)
+            assert table.car_wants_etl(car, toll, time, 45, 30) == expected
+
+def test_decision_cache():
+    """ Cached decisions are only made again once the toll or speeds
+        move a vehicle into another bucket
+
+    """
+    hw = Highway(11, exit_loc_arr=[5, 7, 8, 9, 10], peak_arr=[0]*1440)
+    hw.etl_price, hw.etl_speed, hw.gpl_speed = 1, 40, 30
+    car = Car('North', 5, 5, hw, 10, rng=N.random.default_rng(0), \
+              decision_rng=N.random.default_rng(1), cache_decisions=True)
+    first = car.wants_etl(hw, 16)
+    calls = []
+    car.want_to_move_to_ETL = lambda *args: calls.append(args) or True
+    assert car.wants_etl(hw, 16) == first and calls == []
+    hw.etl_speed = 41
+    assert car.wants_etl(hw, 16) == first and calls == []
+    hw.etl_speed = 90
+    assert car.wants_etl(hw, 16) and len(calls) == 1
+
+    store = VehicleStore(hw)
+    for i in range(6):
+        store.add(2 + i % 2, 20 + 5 * i, 100, income=30000 + 20000 * i)
+    store._place_waiting()
+    rng = N.random.default_rng(2)
+    decide = etl_decision.store_decider(rng=rng, cache=True)
+    idx = N.arange(store.count)
+    first = decide(store, idx, 16)
+    assert (store.decision_key[idx] >= 0).all()
+    state = rng.bit_generator.state
+    assert (decide(store, idx, 16) == first).all()
+    assert rng.bit_generator.state == state
+    hw.etl_price = 10
+    decide(store, idx, 16)
+    assert rng.bit_generator.state != state
+
+if __name__ == "__main__":
+    test_matches_car()
+    test_broadcast()
+    test_weight_sets()
+    test_decision_table()
+    test_decision_cache()
+    print("ETL decision tests passed")
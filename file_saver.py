@@ -1,28 +1,316 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Thu May 30 12:16:10 2019
-
-@author: awsir
-"""
-import matplotlib.pyplot as pp
-import seaborn as sns
-import os
-
-def graph_color_gradient(arr, time_step, min_price, max_price, direct):
-    """cmap = mp.colors.ListedColormap(['black', 'blue', 'red', 'white'])
-    bounds=[-1, 25, 25, 50, 50, 75, 75, 101]
-    norm = mp.colors.BoundaryNorm(bounds, cmap.N)
-    img = pp.imshow(arr,interpolation='nearest',
-                cmap = cmap,norm=norm)
-    
-    # make a color bar
-    pp.colorbar(img,cmap=cmap,
-            norm=norm,boundaries=bounds,ticks=[0, 25, 50, 75, 100])"""
-    pp.rcParams['figure.figsize'] = arr.num_lns,arr.length * arr.grid_per_mile/5
-    ax = sns.heatmap(arr.grid[:, 1:-1, 0], xticklabels=False, yticklabels=False, vmin=0, vmax=1)
-    newpath = os.path.join('D:', os.sep, "traffic_sims", str(direct), str("ETL_SIM_OUTPUT"), str(min_price), str(max_price))
-    if not os.path.exists(newpath):
-        os.makedirs(newpath)
-    os.chdir(newpath)
-    pp.savefig(str(time_step) + '.png')
-    #pp.show()
\ No newline at end of file
+# -*- coding: utf-8 -*-
+"""
+Created on Thu May 30 12:16:10 2019
+
+@author: awsir
+"""
+import matplotlib.pyplot as pp
+import seaborn as sns
+import multiprocessing
+import numpy
+import json
+import os
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def output_path(direct, min_price, max_price, root=os.path.join('D:', os.sep, "traffic_sims")):
+    """
+    Folder the frames of one scenario are written to
+
+    Method Arguments:
+        - direct : direction of the highway, 'north' or 'south'
+        - min_price : minimum toll of the scenario
+        - max_price : maximum toll of the scenario
+        - root : folder holding every simulation output
+    """
+    return os.path.join(root, str(direct), str("ETL_SIM_OUTPUT"), str(min_price), str(max_price))
+
+def graph_color_gradient(arr, time_step, min_price, max_price, direct):
+    """cmap = mp.colors.ListedColormap(['black', 'blue', 'red', 'white'])
+    bounds=[-1, 25, 25, 50, 50, 75, 75, 101]
+    norm = mp.colors.BoundaryNorm(bounds, cmap.N)
+    img = pp.imshow(arr,interpolation='nearest',
+                cmap = cmap,norm=norm)
+
+    # make a color bar
+    pp.colorbar(img,cmap=cmap,
+            norm=norm,boundaries=bounds,ticks=[0, 25, 50, 75, 100])"""
+    pp.rcParams['figure.figsize'] = arr.num_lns,arr.length * arr.grid_per_mile/5
+    ax = sns.heatmap(arr.grid[:, 1:-1, 0], xticklabels=False, yticklabels=False, vmin=0, vmax=1)
+    newpath = output_path(direct, min_price, max_price)
+    if not os.path.exists(newpath):
+        os.makedirs(newpath)
+    pp.savefig(os.path.join(newpath, str(time_step) + '.png'))
+    pp.close(ax.figure)
+    #pp.show()
+
+# figure and image reused by every frame drawn in this process
+_figure = None
+_image = None
+
+def _render_frame(frame, file_name, figsize):
+    """
+    Draw one occupancy frame to a PNG, reusing the figure of this process
+
+    Method Arguments:
+        - frame : 2-D array of the occupied squares of every lane
+        - file_name : full path of the PNG to write
+        - figsize : (width, height) of the figure in inches
+    """
+    global _figure, _image
+    if _figure is None or tuple(_figure.get_size_inches()) != tuple(figsize):
+        _figure = Figure(figsize=figsize)
+        FigureCanvasAgg(_figure)
+        ax = _figure.add_subplot(111)
+        _image = ax.imshow(frame, vmin=0, vmax=1, aspect='auto', \
+                           interpolation='nearest', \
+                           cmap=sns.color_palette("rocket", as_cmap=True))
+        ax.set_xticks([])
+        ax.set_yticks([])
+        _figure.colorbar(_image, ax=ax)
+    else:
+        _image.set_data(frame)
+    _figure.savefig(file_name)
+
+class FrameRenderer:
+    def __init__(self, highway, min_price, max_price, direct, stride=1, \
+                 workers=None, deferred=False, path=None, max_pending=64):
+        """ Heatmap frames of one scenario rendered off the simulation loop
+
+        Method Arguments:
+            - highway : the Highway being drawn
+            - min_price : minimum toll of the scenario
+            - max_price : maximum toll of the scenario
+            - direct : direction of the highway, 'north' or 'south'
+            - stride : only every stride-th time step is drawn
+            - workers : number of rendering processes, None uses every
+              core and 0 draws in this process
+            - deferred : hold every frame and draw them all at close()
+            - path : folder to write to, defaults to output_path()
+            - max_pending : most frames handed to the workers and not
+              drawn yet; capture() waits for the oldest beyond that
+
+        Member Variables:
+            - pending : frames waiting to be drawn at close()
+            - results : frames handed to the worker pool, oldest first;
+              their get() raises any error of the worker that drew them
+        """
+        self.stride = stride
+        self.deferred = deferred
+        self.path = path if path is not None else \
+                    output_path(direct, min_price, max_price)
+        self.figsize = (highway.num_lns, highway.length * highway.grid_per_mile / 5)
+        # pool workers (e.g. during a sweep) cannot start processes
+        if multiprocessing.current_process().daemon:
+            workers = 0
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = []
+        self.results = []
+        self.pool = None
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+    def capture(self, highway, time_step):
+        """
+        Snapshot the occupancy of the lanes for one time step
+
+        Method Arguments:
+            - highway : the Highway being drawn
+            - time_step : number representing the time step in the sequence
+        """
+        if time_step % self.stride != 0:
+            return
+        frame = highway.grid[:, 1:-1, 0].astype('uint8')
+        file_name = os.path.join(self.path, str(time_step) + '.png')
+        if self.deferred:
+            self.pending.append((frame, file_name, self.figsize))
+        elif self.workers == 0:
+            _render_frame(frame, file_name, self.figsize)
+        else:
+            if self.pool is None:
+                self.pool = multiprocessing.Pool(self.workers)
+            # collect the frames already drawn, so a failed one stops the
+            # day here; every queued frame holds a copy of the grid, so
+            # wait for the oldest once too many are queued
+            while self.results and (self.results[0].ready() or \
+                                    len(self.results) >= self.max_pending):
+                self.results.pop(0).get()
+            self.results.append(self.pool.apply_async(_render_frame, \
+                                (frame, file_name, self.figsize)))
+
+    def close(self):
+        """
+        Draw every outstanding frame and wait for the workers to finish
+
+        The workers are shut down even when a frame failed to draw
+        """
+        try:
+            if self.pending:
+                if self.workers == 0:
+                    for args in self.pending:
+                        _render_frame(*args)
+                else:
+                    if self.pool is None:
+                        self.pool = multiprocessing.Pool(self.workers)
+                    self.pool.starmap(_render_frame, self.pending)
+            for r in self.results:
+                r.get()
+        finally:
+            self.pending = []
+            self.results = []
+            if self.pool is not None:
+                self.pool.close()
+                self.pool.join()
+                self.pool = None
+
+TRACE_MAGIC = b'I405TRC1'
+
+def _trace_dtype(rows, cols):
+    """
+    Record layout of one time step in an occupancy trace
+    """
+    return numpy.dtype([('time_step', '<u4'), \
+                        ('bits', 'u1', ((rows * cols + 7) // 8,))])
+
+class OccupancyTraceWriter:
+    def __init__(self, highway, min_price, max_price, direct, stride=1, \
+                 path=None, resume_at=0, replicate=0):
+        """ Raw occupancy of one scenario appended to a single file
+
+        Every captured time step is stored as its number followed by the
+        occupied squares of the lanes packed 8 to a byte, behind a short
+        header giving the shape of the lanes.
+
+        Method Arguments:
+            - highway : the Highway being recorded
+            - min_price : minimum toll of the scenario
+            - max_price : maximum toll of the scenario
+            - direct : direction of the highway, 'north' or 'south'
+            - stride : only every stride-th time step is recorded
+            - path : file to write, defaults to occupancy_<replicate>.trace
+              in output_path()
+            - resume_at : time step a resumed day restarts from; an existing
+              trace keeps its frames before it and is appended to
+            - replicate : number of the repeated run of the scenario, so
+              replicates running side by side write their own files
+        """
+        if path is None:
+            folder = output_path(direct, min_price, max_price)
+            if not os.path.exists(folder):
+                os.makedirs(folder)
+            path = os.path.join(folder, 'occupancy_' + str(replicate) + '.trace')
+        self.path = path
+        self.stride = stride
+        self.rows = numpy.shape(highway.grid)[0]
+        self.cols = numpy.shape(highway.grid)[1] - 2
+        self.record = numpy.zeros(1, dtype=_trace_dtype(self.rows, self.cols))
+        if resume_at > 0 and os.path.exists(path):
+            trace = OccupancyTrace(path)
+            keep = numpy.searchsorted(trace.time_steps, resume_at)
+            end = trace.offset + keep * self.record.itemsize
+            del trace
+            self.file = open(path, 'r+b')
+            # drop frames after the checkpoint, and any half written record
+            self.file.truncate(end)
+            self.file.seek(end)
+            return
+        header = json.dumps({'rows': self.rows, 'cols': self.cols}).encode()
+        self.file = open(path, 'wb')
+        self.file.write(TRACE_MAGIC)
+        self.file.write(numpy.uint32(len(header)).tobytes())
+        self.file.write(header)
+
+    def capture(self, highway, time_step):
+        """
+        Append the occupancy of the lanes for one time step
+
+        Method Arguments:
+            - highway : the Highway being recorded
+            - time_step : number representing the time step in the sequence
+        """
+        if time_step % self.stride != 0:
+            return
+        self.record['time_step'] = time_step
+        self.record['bits'][0] = numpy.packbits(highway.grid[:, 1:-1, 0] != 0)
+        self.file.write(self.record.tobytes())
+
+    def close(self):
+        """
+        Flush and close the trace file
+        """
+        self.file.close()
+
+class OccupancyTrace:
+    def __init__(self, path):
+        """ Lazy reader for a file written by OccupancyTraceWriter
+
+        Method Arguments:
+            - path : trace file to read
+
+        Member Variables:
+            - rows, cols : shape of one frame
+            - offset : size of the header in bytes
+            - time_steps : time step of every recorded frame
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+                raise ValueError(path + " is not an occupancy trace")
+            size = int(numpy.frombuffer(f.read(4), dtype='<u4')[0])
+            header = json.loads(f.read(size).decode())
+        self.rows = header['rows']
+        self.cols = header['cols']
+        self.offset = len(TRACE_MAGIC) + 4 + size
+        dtype = _trace_dtype(self.rows, self.cols)
+        count = (os.path.getsize(path) - self.offset) // dtype.itemsize
+        self.records = numpy.memmap(path, dtype=dtype, mode='r', \
+                                    offset=self.offset, shape=(count,))
+        self.time_steps = numpy.asarray(self.records['time_step'])
+
+    def __len__(self):
+        return len(self.records)
+
+    def _unpack(self, i):
+        bits = numpy.unpackbits(self.records['bits'][i], \
+                                count=self.rows * self.cols)
+        return bits.reshape(self.rows, self.cols)
+
+    def frame(self, time_step):
+        """
+        Occupancy of the lanes at one recorded time step
+
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+        """
+        i = numpy.searchsorted(self.time_steps, time_step)
+        if i == len(self.time_steps) or self.time_steps[i] != time_step:
+            raise KeyError(time_step)
+        return self._unpack(i)
+
+    def frames(self, start=0, stop=None):
+        """
+        Yield (time_step, frame) for the recorded steps in [start, stop)
+
+        Frames are unpacked one at a time as they are requested.
+        """
+        first = numpy.searchsorted(self.time_steps, start)
+        last = len(self.time_steps) if stop is None else \
+               numpy.searchsorted(self.time_steps, stop)
+        for i in range(first, last):
+            yield int(self.time_steps[i]), self._unpack(i)
+
+    def render(self, folder, start=0, stop=None, stride=1):
+        """
+        Draw PNG heatmaps of a range of recorded time steps
+
+        Method Arguments:
+            - folder : where to write the PNGs
+            - start, stop : range of time steps to draw
+            - stride : only every stride-th recorded frame is drawn
+        """
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        figsize = (self.cols, self.rows / 5)
+        for n, (t, frame) in enumerate(self.frames(start, stop)):
+            if n % stride == 0:
+                _render_frame(frame, os.path.join(folder, str(t) + '.png'), figsize)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the frame and trace files.
+
+    Checks occupancy traces read back as written and resume cleanly.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import os
+import shutil
+import tempfile
+
+import file_saver
+from fixtures import make_highway
+
+def write_steps(writer, hw, steps):
+    """ Captures every step with one vehicle square at row time_step
+
+    """
+    for t in steps:
+        hw.occupancy[:] = 0
+        hw.occupancy[2, t] = 1
+        writer.capture(hw, t)
+
+def test_trace_resume():
+    """ A trace reads back a range of steps, and resuming drops the
+        frames written after the resume point
+
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        hw = make_highway()
+        path = os.path.join(folder, 'occupancy_0.trace')
+        writer = file_saver.OccupancyTraceWriter(hw, 1, 5, 'north', path=path)
+        write_steps(writer, hw, range(10))
+        writer.close()
+        trace = file_saver.OccupancyTrace(path)
+        assert list(trace.time_steps) == list(range(10))
+        frames = list(trace.frames(3, 6))
+        assert [t for t, frame in frames] == [3, 4, 5]
+        for t, frame in frames:
+            assert frame.shape == (trace.rows, trace.cols)
+            assert frame[t, 1] == 1 and frame.sum() == 1
+        del trace, frames
+        # a day resumed at step 6 writes steps 6 and on again
+        with open(path, 'ab') as f:
+            f.write(b'\x01\x02')
+        writer = file_saver.OccupancyTraceWriter(hw, 1, 5, 'north', \
+                                                 path=path, resume_at=6)
+        write_steps(writer, hw, range(6, 8))
+        writer.close()
+        trace = file_saver.OccupancyTrace(path)
+        assert list(trace.time_steps) == list(range(8))
+        assert trace.frame(7)[7, 1] == 1
+        del trace
+    finally:
+        shutil.rmtree(folder)
+
+def test_renderer_errors():
+    """ Frames drawn by the workers stay bounded and their errors reach
+        the simulation
+
+    """
+    folder = tempfile.mkdtemp()
+    hw = make_highway()
+    renderer = file_saver.FrameRenderer(hw, 1, 5, 'north', workers=1, \
+                                        path=folder, max_pending=2)
+    try:
+        renderer.capture(hw, 0)
+        renderer.capture(hw, 1)
+        renderer.capture(hw, 2)
+        assert len(renderer.results) <= 2
+        for result in renderer.results:
+            result.wait()
+        # the frames of a missing folder cannot be written
+        shutil.rmtree(folder)
+        renderer.capture(hw, 3)
+        renderer.results[-1].wait()
+        os.makedirs(folder)
+        failed = False
+        try:
+            # the next frame collects the failed one
+            renderer.capture(hw, 4)
+        except (IOError, OSError):
+            failed = True
+        assert failed
+        renderer.close()
+    finally:
+        if renderer.pool is not None:
+            renderer.pool.terminate()
+        shutil.rmtree(folder, ignore_errors=True)
+
+if __name__ == "__main__":
+    test_trace_resume()
+    test_renderer_errors()
+    print("File saver tests passed")
@@ -0,0 +1,25 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Shared Test Fixtures for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: fixtures.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - Objects built the same way by several *_test.py files, kept in one
+#   place so their setups cannot drift apart
+
+#=======================================================================
+
+from highway import Highway
+
+def make_highway():
+    """
+    Small highway used by the tests: 11 miles, exits at miles 5, 7, 8, 9
+    and 10, and no peak minutes
+    """
+    return Highway(11, exit_loc_arr=[5, 7, 8, 9, 10], peak_arr=[0]*1440)
@@ -1,181 +1,667 @@
-#=======================================================================
-#                        General Documentation
-#
-    # Agent for I-405 Simulation
-#
-#-----------------------Additional Documentation------------------------
-
-# Modification History:
-# - 19 May 2019: Bus.py created by Adam Sirkis
-# - 04 June 2019: Bus.py finalized by Adam Sirkis
-
-# Notes:
-# - Developed for Python 3.x
-
-#=======================================================================
-
-import numpy
-import math
-
-from enter import Enter
-from exit import Exit
-"""from gpl import GPL
-from etl import ETL"""
-
-class Highway:
-    def __init__(self, length, num_norm_lns=2, num_etl=1, peak_arr=[],\
-                 shoulder_arr=[], min_toll=0.75, \
-                 max_toll=10.00, exit_loc_arr=[],\
-                 start_tolling=500, end_tolling=1900, etl_on=[]):
-        """ Construct a Highway
-        
-        Method Arguments:
-            - length: number to rpesent the length of the highway
-            - num_norm_lns : number of GPL lanes
-            - num_etl: number of ETL
-            -peak_arr : array-like of the peak traffic times
-            - shoulder_arr[] : array-like of time the shoulder is open
-            - min_toll : number repesenting the minimum toll
-            - max_toll : number representing the maximum toll
-            - exit_loc_arr : array-like representing the locatiosn of exit
-            - start_tolling : time to start tolling
-            - end_tolling : time to end tolling
-            - etl_on : array-like of locations that vehicles can enter the ETL
-            
-        Member Variables:
-            - num_lns : total number of lanes
-            - grid_per_mile : number of grid squares per mile
-            - shoulder_open : bool representing if the shoulder is open
-            - etl_speed : current speed fo the ETL
-            - gpl_speed : current speed of the GPL
-            - Grid: 3-D Numpy arraay defined by _generate_road
-        
-        """
-        self.num_norm_lns = num_norm_lns
-        self.num_etl_lns = num_etl
-        self.num_lns = num_norm_lns + num_etl
-        self.length = length
-        self.is_peak = numpy.array(peak_arr)
-        self.is_shoulder = numpy.array(shoulder_arr)
-        self.min_toll = min_toll
-        self.max_toll = max_toll
-        self.grid_per_mile = 10
-        self.exits_arr = []
-        self.entrance_arr = []
-        self.tolling_start = start_tolling
-        self.tolling_end = end_tolling
-        self.shoulder_open = False
-        self.etl_price = 0
-        self.grid = self._generate_road(exit_loc_arr)
-        self.etl_entry_arr = etl_on
-        self.etl_speed = 60
-        self.gpl_speed = 60
-
-        
-    def _generate_road(self, exits):
-        """
-        First Axis represents the length of the roadway
-        
-        Second Axis represents Width fo the roadway, including buffer barriers
-        
-        Axis 3 Stores extra information
-        
-        The first index stores if there is a vehicle (0 = false, 1 = true)
-        The second index stores the type of terrain (0 = GPL, 1 = ETL, 2 = barrier)
-        Third Index stores if it is an On-ramp, Off-ramp, or neither (0 = neither, 1 = On-ramp, 2 = Off-ramp)
-        Fourth Index stores current price (GPL = 0.00, ETL = max_toll where is_peak is true, ETL = min_toll where is_peak = false and is_toll = true, ETL = 0.00 where is_peak and is_toll are false)
-        
-        
-        Method Arguments:
-            - exits: aray of exit locations
-            
-        Returns:
-            - grid representing the roadway
-        """
-        roadway = numpy.zeros((self.length*self.grid_per_mile, self.num_norm_lns + self.num_etl_lns + 2, 4), dtype='f')
-        #Build Barriers on Either side
-        for i in range(numpy.shape(roadway)[0]):            
-            roadway[i, 0, 1] = 2
-            roadway[i, -1, 1] = 2
-            for j in range(self.num_etl_lns):
-                roadway[i, j + 1, 1] = 1
-        #Generate Exits and Entrances (Paired Sets)
-        for i in exits:
-            roadway[math.floor(i*self.grid_per_mile), 3, 3] = 2
-            self.exits_arr.append(Exit(i,self.grid_per_mile, i*self.grid_per_mile))
-            roadway[math.ceil(i*self.grid_per_mile), 3, 3] = 1
-            self.entrance_arr.append(Enter(i,self.grid_per_mile, i*self.grid_per_mile))
-        roadway[self.length - 1, 3, 3] = 2
-        roadway[self.length - 1, 2, 3] = 2
-        roadway[self.length - 1, 1, 3] = 2
-        self.exits_arr.append(Exit(self.length,self.grid_per_mile, self.length * self.grid_per_mile))
-        roadway[0, 3, 3] = 1
-        roadway[0, 2, 3] = 1
-        roadway[0, 1, 3] = 1
-        self.exits_arr.append(Enter(0,self.grid_per_mile, 0))        
-        return roadway
-    
-    def get_speed(self, grid_moved, time, lane):
-        """
-        Calculate the Average speed of a lane
-        
-        Method Arguments:
-            -lane i: index of the lane (from left to right)
-            -grid_moved : the aggregate number of squares moved
-            -time : is the timestep used (fractions of an hour)
-        
-        vehiucles must report number of squares moved
-        """
-        num_vehicles = 0
-        for i in range(self.length*self.grid_per_mile):
-            if self.grid[i, 1 + lane, 0] == 1:
-                num_vehicles += 1
-        if num_vehicles == 0:
-            num_vehicles += 1
-        miles_moved = grid_moved / self.grid_per_mile
-        miles_per_vehicle = miles_moved / num_vehicles
-        
-        miles_per_vehicle_per_hour = miles_per_vehicle * 1 / time
-        return miles_per_vehicle_per_hour
-    
-    def set_toll(self, time_step):
-        """
-        Set the toll fo the ETL
-        
-        Methdo Arguments:
-            - time_step : numebr representing the time step in the seuqence
-        """
-        if time_step >= self.tolling_start and time_step < self.tolling_end:
-            if self.is_peak[time_step]:
-                self.etl_price = self.max_toll
-                for i in range(numpy.shape(self.grid)[0]):
-                    self.grid[i, 1, 3] = self.max_toll
-            else:
-                for i in range(numpy.shape(self.grid)[0]):
-                    self.grid[i, 1, 3] = self.min_toll
-                self.etl_price = self.min_toll
-        else:
-            for i in range(numpy.shape(self.grid)[0]):
-                self.grid[i, 1, 3] = 0
-            self.etl_price = 0
-
-    def open_shoulder(self, time_step):
-        """
-        Open the HSoulder
-        
-        Method Arguments:
-            - time_step : number representing the time step in the sequence
-        """
-        if time_step >= self.start_shoulder and \
-        time_step < self.end_shoulder and \
-        self.shoulder_open == False:
-            self.shoulder_open = True
-            self.num_norm_lns += 1
-        elif time_step >= self.start_shoulder \
-        and time_step < self.end_shoulder \
-        and self.shoulder_open == True:
-            pass
-        else:
-            self.shoulder_open = False
-            self.num_norm_lns -= 1
-            
+#=======================================================================
+#                        General Documentation
+#
+    # Agent for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 19 May 2019: Bus.py created by Adam Sirkis
+# - 04 June 2019: Bus.py finalized by Adam Sirkis
+
+# Notes:
+# - Developed for Python 3.x
+
+#=======================================================================
+
+import numpy
+import math
+import bisect
+
+from enter import Enter
+from exit import Exit
+from ramps import RampQueues
+"""from gpl import GPL
+from etl import ETL"""
+
+class GridView(object):
+    """ The planes of a Highway seen as the (rows, columns, 4) grid of
+        earlier versions, for code that still indexes highway.grid
+
+        grid[y, x, 0] is occupancy[x, y], grid[y, x, 1] is terrain[x, y],
+        grid[y, x, 2] is always 0 and grid[y, x, 3] the ramp flag, or the
+        price of the lane for the toll lanes once a toll is set. Indexing
+        with a single channel gives a view of occupancy or terrain that
+        can be written through; channels 2 and 3 are copies. Occupancy
+        written with grid[y, x, 0] = v keeps lane_squares and
+        occupied_rows up to date, writes to the views do not.
+    """
+    ndim = 3
+
+    def __init__(self, highway):
+        self.highway = highway
+
+    @property
+    def shape(self):
+        cols, rows = numpy.shape(self.highway.occupancy)
+        return (rows, cols, 4)
+
+    def __len__(self):
+        return numpy.shape(self.highway.occupancy)[1]
+
+    def _channel(self, channel):
+        hw = self.highway
+        if channel == 0:
+            return hw.occupancy.T
+        if channel == 1:
+            return hw.terrain.T
+        if channel == 2:
+            return numpy.zeros(self.shape[:2], dtype='f')
+        if channel == 3:
+            return hw.price_plane().T
+        raise IndexError("grid has 4 channels, not " + str(channel))
+
+    def __array__(self, dtype=None, copy=None):
+        grid = numpy.stack([self._channel(c) for c in range(4)], axis=2)
+        return grid.astype('f' if dtype is None else dtype)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 3 and \
+           isinstance(key[2], (int, numpy.integer)):
+            return self._channel(key[2])[key[0], key[1]]
+        return self.__array__()[key]
+
+    def __setitem__(self, key, value):
+        if not (isinstance(key, tuple) and len(key) == 3 and key[2] in (0, 1)):
+            raise IndexError("only occupancy (0) and terrain (1) can be " + \
+                             "written through highway.grid")
+        hw = self.highway
+        if key[2] == 1:
+            hw.terrain.T[key[0], key[1]] = value
+            return
+        y, x = key[0], key[1]
+        if isinstance(y, (int, numpy.integer)) and \
+           isinstance(x, (int, numpy.integer)) and numpy.ndim(value) == 0:
+            # one square keeps the lane counts and the gap index as is
+            if value:
+                hw.occupy(y, x)
+            else:
+                hw.vacate(y, x)
+            return
+        hw.occupancy.T[y, x] = value
+        hw.occupancy_changed()
+        hw.lane_squares[:] = numpy.count_nonzero(hw.occupancy[1:-1], axis=1)
+
+
+class Highway:
+    def __init__(self, length, num_norm_lns=2, num_etl=1, peak_arr=[],\
+                 shoulder_arr=[], min_toll=0.75, \
+                 max_toll=10.00, exit_loc_arr=[],\
+                 start_tolling=500, end_tolling=1900, etl_on=[]):
+        """ Construct a Highway
+        
+        Method Arguments:
+            - length: number to rpesent the length of the highway
+            - num_norm_lns : number of GPL lanes
+            - num_etl: number of ETL
+            -peak_arr : array-like of the peak traffic times
+            - shoulder_arr[] : array-like of time the shoulder is open
+            - min_toll : number repesenting the minimum toll
+            - max_toll : number representing the maximum toll
+            - exit_loc_arr : array-like representing the locatiosn of exit
+            - start_tolling : time to start tolling
+            - end_tolling : time to end tolling
+            - etl_on : array-like of locations that vehicles can enter the ETL
+            
+        Member Variables:
+            - num_lns : total number of lanes
+            - grid_per_mile : number of grid squares per mile
+            - shoulder_open : bool representing if the shoulder is open
+            - etl_speed : current speed fo the ETL
+            - gpl_speed : current speed of the GPL
+            - occupancy : uint8 (columns, rows), 1 where a vehicle is
+            - terrain : uint8 (columns, rows), 0 GPL, 1 ETL, 2 barrier
+            - ramp_flags : int8 (columns, rows), 1 on-ramp, 2 off-ramp
+            - lane_price : float32 price of every column (the toll lanes
+              once a toll is set)
+            - grid : GridView of the planes in the old (rows, columns, 4)
+              layout
+            - lane_counts : number of vehicles in each lane (from left to right)
+            - lane_squares : number of occupied squares in each lane, kept
+              by occupy, vacate and squares_changed
+            - toll_schedule : ETL price for every time step covered by peak_arr
+            - occupied_rows : sorted rows of the occupied squares of every
+              column of the grid, see next_occupied
+            - exit_ys, entrance_ys : sorted y of the exits and entrances,
+              see next_exit and next_entrance
+            - ramps : RampQueues of exits_arr followed by entrance_arr,
+              served by ramps.step every time step
+            - moved, movers : int32 (columns, rows) squares moved in the
+              current step by the vehicle on each square, and number of
+              vehicles recorded there, None until track_moves is called
+              (the vehicle engines only record moves once they exist)
+            - segment_density, segment_flow, segment_speed : float32
+              (time steps, miles, lanes) vehicles per mile, vehicles per
+              hour and space-mean speed of every lane in every mile, None
+              until track_segments is called
+        
+        """
+        self.num_norm_lns = num_norm_lns
+        self.num_etl_lns = num_etl
+        self.num_lns = num_norm_lns + num_etl
+        self.length = length
+        self.is_peak = numpy.array(peak_arr)
+        self.is_shoulder = numpy.array(shoulder_arr)
+        self.min_toll = min_toll
+        self.max_toll = max_toll
+        self.grid_per_mile = 10
+        self.exits_arr = []
+        self.entrance_arr = []
+        self.tolling_start = start_tolling
+        self.tolling_end = end_tolling
+        self.shoulder_open = False
+        self.etl_price = 0
+        self.lane_price = numpy.zeros(num_norm_lns + num_etl + 2, dtype=numpy.float32)
+        self.occupancy, self.terrain, self.ramp_flags = \
+            self._generate_road(exit_loc_arr)
+        self.grid = GridView(self)
+        self._build_ramp_tables()
+        self.ramps = RampQueues.attach(self.exits_arr + self.entrance_arr)
+        self.etl_entry_arr = etl_on
+        self.etl_speed = 60
+        self.gpl_speed = 60
+        self.lane_counts = numpy.zeros(self.num_lns, dtype=int)
+        self.lane_squares = numpy.zeros(self.num_lns, dtype=int)
+        self.moved = None
+        self.movers = None
+        self.segment_density = None
+        self.segment_flow = None
+        self.segment_speed = None
+        self.toll_schedule = self._generate_toll_schedule()
+        self._applied_toll = None
+        self.occupied_rows = None
+
+        
+    def _generate_road(self, exits):
+        """
+        Every plane is indexed [column, row]: the first axis is the width of
+        the roadway, including buffer barriers, the second its length, so
+        the squares of one lane are next to each other in memory
+        
+        occupancy stores if there is a vehicle (0 = false, 1 = true)
+        terrain stores the type of terrain (0 = GPL, 1 = ETL, 2 = barrier)
+        ramp_flags stores if it is an On-ramp, Off-ramp, or neither (0 = neither, 1 = On-ramp, 2 = Off-ramp)
+        The current price is kept per lane in lane_price (see set_toll)
+        
+        
+        Method Arguments:
+            - exits: aray of exit locations
+            
+        Returns:
+            - occupancy, terrain and ramp_flags planes of the roadway
+        """
+        shape = (self.num_norm_lns + self.num_etl_lns + 2, self.length*self.grid_per_mile)
+        occupancy = numpy.zeros(shape, dtype=numpy.uint8)
+        terrain = numpy.zeros(shape, dtype=numpy.uint8)
+        ramp_flags = numpy.zeros(shape, dtype=numpy.int8)
+        #Build Barriers on Either side
+        terrain[0, :] = 2
+        terrain[-1, :] = 2
+        terrain[1:self.num_etl_lns + 1, :] = 1
+        #Generate Exits and Entrances (Paired Sets)
+        for i in exits:
+            ramp_flags[3, math.floor(i*self.grid_per_mile)] = 2
+            self.exits_arr.append(Exit(i,self.grid_per_mile, i*self.grid_per_mile))
+            ramp_flags[3, math.ceil(i*self.grid_per_mile)] = 1
+            self.entrance_arr.append(Enter(i,self.grid_per_mile, i*self.grid_per_mile))
+        ramp_flags[1:4, self.length - 1] = 2
+        self.exits_arr.append(Exit(self.length,self.grid_per_mile, self.length * self.grid_per_mile))
+        ramp_flags[1:4, 0] = 1
+        self.exits_arr.append(Enter(0,self.grid_per_mile, 0))        
+        return occupancy, terrain, ramp_flags
+
+    def price_plane(self):
+        """
+        Ramp flags with the price of the toll lanes written over them once
+        a toll is set, as channel 3 of the old grid held them
+        
+        Returns:
+            - float32 (columns, rows) array
+        """
+        plane = self.ramp_flags.astype(numpy.float32)
+        if self._applied_toll is not None:
+            plane[1:self.num_etl_lns + 1, :] = \
+                self.lane_price[1:self.num_etl_lns + 1, None]
+        return plane
+    
+    def _build_ramp_tables(self):
+        """
+        Build the lookup tables of exits_arr and entrance_arr
+        
+        Ramps are keyed by the object itself (position in its list), by id
+        and by y, and sorted by y so the next one downstream is a bisect
+        """
+        self._exit_pos = {ramp: i for i, ramp in enumerate(self.exits_arr)}
+        self._exit_ids = {}
+        self._exit_at = {}
+        for ramp in reversed(self.exits_arr):
+            self._exit_ids[ramp.id] = ramp
+            self._exit_at[ramp.y] = ramp
+        ordered = sorted(self.exits_arr, key=lambda ramp: ramp.y)
+        self.exit_ys = [ramp.y for ramp in ordered]
+        self._exits_by_y = ordered
+        self._entrance_ids = {ramp.id: ramp for ramp in self.entrance_arr}
+        ordered = sorted(self.entrance_arr, key=lambda ramp: ramp.y)
+        self.entrance_ys = [ramp.y for ramp in ordered]
+        self._entrances_by_y = ordered
+    
+    def exit_position(self, ramp):
+        """
+        Index of an exit in exits_arr
+        
+        Method Arguments:
+            - ramp : Exit object belonging to this highway
+        """
+        return self._exit_pos[ramp]
+    
+    def exit_by_id(self, number):
+        """
+        Look up an exit by its number
+        
+        Method Arguments:
+            - number : id of the exit
+        """
+        return self._exit_ids[number]
+    
+    def exit_at(self, y, default=None):
+        """
+        Exit located at a y coordinate
+        
+        Method Arguments:
+            - y : coordinate lengthwise along the highway
+            - default : returned when no exit is at y, exits_arr[-1] if None
+        """
+        if default is None:
+            default = self.exits_arr[-1]
+        return self._exit_at.get(y, default)
+    
+    def next_exit(self, y):
+        """
+        First exit downstream of a y coordinate
+        
+        Method Arguments:
+            - y : coordinate lengthwise along the highway
+            
+        Returns:
+            - Exit object, or exits_arr[-1] when there is none ahead
+        """
+        i = bisect.bisect_right(self.exit_ys, y)
+        if i < len(self._exits_by_y):
+            return self._exits_by_y[i]
+        return self.exits_arr[-1]
+    
+    def entrance_by_id(self, number):
+        """
+        Look up an entrance by its number
+        
+        Method Arguments:
+            - number : id of the entrance
+        """
+        return self._entrance_ids[number]
+    
+    def next_entrance(self, y):
+        """
+        First entrance downstream of a y coordinate
+        
+        Method Arguments:
+            - y : coordinate lengthwise along the highway
+            
+        Returns:
+            - Enter object, or None when there is none ahead
+        """
+        i = bisect.bisect_right(self.entrance_ys, y)
+        if i < len(self._entrances_by_y):
+            return self._entrances_by_y[i]
+        return None
+    
+    def get_speed(self, grid_moved, time, lane):
+        """
+        Calculate the Average speed of a lane
+        
+        Method Arguments:
+            -lane i: index of the lane (from left to right)
+            -grid_moved : the aggregate number of squares moved
+            -time : is the timestep used (fractions of an hour)
+        
+        vehiucles must report number of squares moved; the squares moved
+        are shared by the occupied squares of the lane
+        """
+        num_vehicles = self.lane_squares[lane]
+        if num_vehicles == 0:
+            num_vehicles += 1
+        miles_moved = grid_moved / self.grid_per_mile
+        miles_per_vehicle = miles_moved / num_vehicles
+        
+        miles_per_vehicle_per_hour = miles_per_vehicle * 1 / time
+        return miles_per_vehicle_per_hour
+    
+    def lane_speeds(self, grid_moved=None, time=1/60.0):
+        """
+        Average speed of every lane at once, as get_speed gives it for one
+        
+        Method Arguments:
+            - grid_moved : squares moved in every lane (from left to
+              right), defaults to the squares recorded with record_moves
+            - time : is the timestep used (fractions of an hour)
+        
+        Returns:
+            - float array with one speed per lane
+        """
+        if grid_moved is None:
+            self._check_moves()
+            grid_moved = self.moved[1:-1].sum(axis=1)
+        # an empty lane counts as one square, as in get_speed
+        num_vehicles = numpy.maximum(self.lane_squares, 1)
+        miles_per_vehicle = grid_moved / self.grid_per_mile / num_vehicles
+        return miles_per_vehicle * 1 / time
+    
+    def track_moves(self):
+        """
+        Have the vehicle engines record where the squares of every time
+        step were moved (see record_moves)
+        """
+        if self.moved is None:
+            self.moved = numpy.zeros(numpy.shape(self.occupancy), dtype=numpy.int32)
+            self.movers = numpy.zeros(numpy.shape(self.occupancy), dtype=numpy.int32)
+    
+    def _check_moves(self):
+        if self.moved is None:
+            raise ValueError("no moves were recorded, call track_moves "
+                             "before the vehicles move")
+    
+    def clear_moves(self):
+        """
+        Start recording the moves of a new time step
+        """
+        self.moved.fill(0)
+        self.movers.fill(0)
+    
+    def record_moves(self, x, y, squares):
+        """
+        Record the squares vehicles moved in this time step where they
+        ended it, for speed_profile
+        
+        Method Arguments:
+            - x : column of every vehicle (or of one vehicle)
+            - y : row of every vehicle
+            - squares : squares moved by every vehicle
+        """
+        y = numpy.minimum(y, self.length * self.grid_per_mile - 1)
+        numpy.add.at(self.moved, (x, y), squares)
+        numpy.add.at(self.movers, (x, y), 1)
+    
+    def _segment_moves(self):
+        """
+        Squares moved and vehicles recorded in every mile of every lane
+        
+        Returns:
+            - two int arrays (miles, lanes)
+        """
+        self._check_moves()
+        shape = (self.num_lns, self.length, self.grid_per_mile)
+        moved = self.moved[1:-1].reshape(shape).sum(axis=2)
+        movers = self.movers[1:-1].reshape(shape).sum(axis=2)
+        return moved.T, movers.T
+    
+    def speed_profile(self, time=1/60.0):
+        """
+        Average speed of every lane in every mile of the highway, from
+        the moves recorded in this time step
+        
+        Method Arguments:
+            - time : is the timestep used (fractions of an hour)
+        
+        Returns:
+            - float array (miles, lanes), 0 where no vehicle was recorded
+
+        Speeds are per vehicle recorded in the mile, where lane_speeds
+        shares the squares moved by the occupied squares of the lane
+        """
+        moved, movers = self._segment_moves()
+        miles_per_vehicle = moved / self.grid_per_mile / numpy.maximum(movers, 1)
+        return miles_per_vehicle * 1 / time
+    
+    def track_segments(self, time_steps):
+        """
+        Keep the density, flow and speed of every lane in every mile for
+        a number of time steps (see record_segments), and have the
+        vehicle engines record their moves
+        
+        Method Arguments:
+            - time_steps : number of time steps to hold
+        """
+        shape = (time_steps, self.length, self.num_lns)
+        self.segment_density = numpy.zeros(shape, dtype=numpy.float32)
+        self.segment_flow = numpy.zeros(shape, dtype=numpy.float32)
+        self.segment_speed = numpy.zeros(shape, dtype=numpy.float32)
+        self.track_moves()
+    
+    def record_segments(self, time_step, time=1/60.0):
+        """
+        Store the density, flow and space-mean speed of every lane in
+        every mile from the moves recorded in this time step
+        
+        Method Arguments:
+            - time_step : row of the segment arrays to write
+            - time : is the timestep used (fractions of an hour)
+        """
+        moved, movers = self._segment_moves()
+        # miles are one mile long, so the vehicles in one are its density
+        self.segment_density[time_step] = movers
+        # flow = density * speed, the miles moved per hour in the mile
+        self.segment_flow[time_step] = moved / self.grid_per_mile * 1 / time
+        self.segment_speed[time_step] = moved / self.grid_per_mile / \
+                                        numpy.maximum(movers, 1) * 1 / time
+    
+    def vehicle_entered(self, lane):
+        """
+        Count vehicles entering a lane
+        
+        Method Arguments:
+            - lane : index of the lane (from left to right), or an array of
+              indices with one entry per vehicle
+        """
+        numpy.add.at(self.lane_counts, lane, 1)
+    
+    def vehicle_shifted(self, old_lane, new_lane):
+        """
+        Move vehicles from one lane count to another
+        
+        Method Arguments:
+            - old_lane : index of the lane the vehicle left (or an array)
+            - new_lane : index of the lane the vehicle moved to (or an array)
+        """
+        numpy.add.at(self.lane_counts, old_lane, -1)
+        numpy.add.at(self.lane_counts, new_lane, 1)
+    
+    def vehicle_exited(self, lane):
+        """
+        Count vehicles leaving the highway from a lane
+        
+        Method Arguments:
+            - lane : index of the lane (from left to right), or an array of
+              indices with one entry per vehicle
+        """
+        numpy.add.at(self.lane_counts, lane, -1)
+    
+    def squares_changed(self, col, squares):
+        """
+        Count squares written to the occupancy plane without occupy and
+        vacate, as the vehicle store does in bulk
+        
+        Method Arguments:
+            - col : grid column of the squares (or an array)
+            - squares : squares filled, negative when emptied (or an array)
+        """
+        numpy.add.at(self.lane_squares, numpy.asarray(col) - 1, squares)
+    
+    def get_lane_count(self, lane):
+        """
+        Number of vehicles currently in a lane
+        
+        Method Arguments:
+            - lane : index of the lane (from left to right)
+        """
+        return int(self.lane_counts[lane])
+    
+    def get_lane_counts(self):
+        """
+        Number of vehicles currently in every lane (from left to right)
+        """
+        return self.lane_counts.copy()
+    
+    def _build_occupied_rows(self):
+        """
+        Rebuild occupied_rows from the occupancy channel of the grid
+        """
+        self.occupied_rows = [numpy.flatnonzero(lane).tolist() \
+                              for lane in self.occupancy]
+    
+    def occupancy_changed(self):
+        """
+        Mark occupied_rows out of date after writing occupancy directly
+        
+        The index is rebuilt the next time a gap is looked up
+        """
+        self.occupied_rows = None
+    
+    def occupy(self, row, col):
+        """
+        Mark a square of the grid as holding a vehicle
+        
+        Method Arguments:
+            - row : index along the length of the highway
+            - col : index across the width of the highway (grid column)
+        """
+        # only squares that change are counted, and the barriers are not
+        if self.occupancy[col, row] == 0 and 0 < col <= self.num_lns:
+            self.lane_squares[col - 1] += 1
+        self.occupancy[col, row] = 1
+        if self.occupied_rows is not None:
+            # negative rows count from the end, as when indexing the grid
+            row = row % numpy.shape(self.occupancy)[1]
+            rows = self.occupied_rows[col]
+            i = bisect.bisect_left(rows, row)
+            if i == len(rows) or rows[i] != row:
+                rows.insert(i, row)
+    
+    def vacate(self, row, col):
+        """
+        Mark a square of the grid as empty
+        
+        Method Arguments:
+            - row : index along the length of the highway
+            - col : index across the width of the highway (grid column)
+        """
+        if self.occupancy[col, row] != 0 and 0 < col <= self.num_lns:
+            self.lane_squares[col - 1] -= 1
+        self.occupancy[col, row] = 0
+        if self.occupied_rows is not None:
+            row = row % numpy.shape(self.occupancy)[1]
+            rows = self.occupied_rows[col]
+            i = bisect.bisect_left(rows, row)
+            if i < len(rows) and rows[i] == row:
+                del rows[i]
+    
+    def next_occupied(self, row, col):
+        """
+        First occupied square at or ahead of a row in one grid column
+        
+        Method Arguments:
+            - row : index along the length of the highway to search from
+            - col : index across the width of the highway (grid column)
+            
+        Returns:
+            - row of the square, or the number of rows when the rest of the
+              column is empty
+        """
+        if self.occupied_rows is None:
+            self._build_occupied_rows()
+        rows = self.occupied_rows[col]
+        i = bisect.bisect_left(rows, row)
+        if i < len(rows):
+            return rows[i]
+        return numpy.shape(self.occupancy)[1]
+    
+    def _toll_at(self, time_step):
+        """
+        Work out the toll of the ETL at one time step
+        
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+        """
+        if time_step >= self.tolling_start and time_step < self.tolling_end:
+            if self.is_peak[time_step]:
+                return self.max_toll
+            return self.min_toll
+        return 0
+    
+    def _generate_toll_schedule(self):
+        """
+        Work out the toll of the ETL for every time step in is_peak
+        
+        Returns:
+            - 1-D Numpy array indexed by time step
+        """
+        steps = numpy.arange(len(self.is_peak))
+        tolling = (steps >= self.tolling_start) & (steps < self.tolling_end)
+        peak = self.is_peak.astype(bool)
+        return numpy.where(tolling, numpy.where(peak, self.max_toll, \
+                                                self.min_toll), 0)
+    
+    def get_toll(self, time_step):
+        """
+        Look up the toll of the ETL at a time step
+        
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+        """
+        if 0 <= time_step < len(self.toll_schedule):
+            return self.toll_schedule[time_step].item()
+        return self._toll_at(time_step)
+    
+    def set_toll(self, time_step):
+        """
+        Set the toll fo the ETL
+        
+        The price of the toll lanes is only rewritten when the toll changes
+        
+        Methdo Arguments:
+            - time_step : numebr representing the time step in the seuqence
+        """
+        price = self.get_toll(time_step)
+        if price != self._applied_toll:
+            self.lane_price[1:self.num_etl_lns + 1] = price
+            self._applied_toll = price
+        self.etl_price = price
+
+    def open_shoulder(self, time_step):
+        """
+        Open the HSoulder
+        
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+        """
+        if time_step >= self.start_shoulder and \
+        time_step < self.end_shoulder and \
+        self.shoulder_open == False:
+            self.shoulder_open = True
+            self.num_norm_lns += 1
+        elif time_step >= self.start_shoulder \
+        and time_step < self.end_shoulder \
+        and self.shoulder_open == True:
+            pass
+        else:
+            self.shoulder_open = False
+            self.num_norm_lns -= 1
+            
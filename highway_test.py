@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the Highway object.
+
+    Checks the bookkeeping the Highway keeps alongside its grid.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import numpy
+
+from fixtures import make_highway
+from highway import Highway
+
+def test_lane_counts():
+    """ Lane counts follow vehicles entering, shifting and exiting
+
+    """
+    hw = make_highway()
+    hw.vehicle_entered(2)
+    hw.vehicle_entered([2, 1])
+    assert list(hw.get_lane_counts()) == [0, 1, 2]
+    hw.vehicle_shifted(2, 0)
+    assert hw.get_lane_count(0) == 1 and hw.get_lane_count(2) == 1
+    hw.vehicle_exited(0)
+    assert list(hw.get_lane_counts()) == [0, 1, 1]
+    # the squares moved are shared by the occupied squares of the lane
+    hw.occupy(10, 2)
+    hw.occupy(9, 2)
+    hw.occupy(20, 3)
+    hw.occupy(20, 3)
+    assert list(hw.lane_squares) == [0, 2, 1]
+    assert hw.get_speed(20, 1/60.0, 1) == 60
+    assert hw.get_speed(20, 1/60.0, 1) == hw.get_speed(20, 1/60.0, 2) / 2
+    hw.vacate(9, 2)
+    hw.vacate(9, 2)
+    assert list(hw.lane_squares) == [0, 1, 1]
+    hw.squares_changed(numpy.array([1, 1, 3]), 1)
+    assert list(hw.lane_squares) == [2, 1, 2]
+    # an empty lane does not divide by zero
+    assert hw.get_speed(0, 1/60.0, 0) == 0
+
+def test_toll_schedule():
+    """ The precomputed schedule matches the tolling rules
+
+    """
+    peak = [0]*15 + [1]*3 + [0]*6
+    hw = Highway(11, exit_loc_arr=[5], peak_arr=peak, min_toll=1, \
+                 max_toll=5, start_tolling=5, end_tolling=19)
+    for t in range(24):
+        hw.set_toll(t)
+        if t < 5 or t >= 19:
+            expected = 0
+        elif peak[t]:
+            expected = 5
+        else:
+            expected = 1
+        assert hw.etl_price == expected
+        assert hw.get_toll(t) == expected
+        assert (hw.grid[:, 1, 3] == expected).all()
+
+def test_next_occupied():
+    """ The gap index follows occupy/vacate and direct grid writes
+
+    """
+    hw = make_highway()
+    rows = len(hw.grid)
+    assert hw.next_occupied(0, 2) == rows
+    hw.occupy(30, 2)
+    hw.occupy(10, 2)
+    assert hw.next_occupied(0, 2) == 10
+    assert hw.next_occupied(11, 2) == 30
+    hw.vacate(10, 2)
+    assert hw.next_occupied(0, 2) == 30
+    assert hw.next_occupied(0, 3) == rows
+    hw.grid[20, 3, 0] = 1
+    assert hw.next_occupied(0, 3) == 20
+    hw.grid[5:8, 3, 0] = 1
+    assert hw.next_occupied(0, 3) == 5
+    assert list(hw.lane_squares) == [0, 1, 4]
+    hw.grid[5, 3, 0] = 0
+    assert hw.next_occupied(0, 3) == 6
+    assert list(hw.lane_squares) == [0, 1, 3]
+
+def test_ramp_lookup():
+    """ Exits are found by object, id, y and position downstream
+
+    """
+    hw = make_highway()
+    for i, ramp in enumerate(hw.exits_arr):
+        assert hw.exit_position(ramp) == i
+    assert hw.exit_by_id(7).y == 70
+    assert hw.exit_at(80).id == 8
+    assert hw.exit_at(81) is hw.exits_arr[-1]
+    assert hw.next_exit(0).y == 50
+    assert hw.next_exit(70).y == 80
+    assert hw.next_exit(75).y == 80
+    assert hw.next_exit(len(hw.grid)) is hw.exits_arr[-1]
+    assert hw.next_entrance(50).id == 7
+    assert hw.next_entrance(100) is None
+
+def test_grid_view():
+    """ The typed planes read and write through the old grid layout
+
+    """
+    hw = make_highway()
+    rows = len(hw.grid)
+    assert hw.grid.shape == (rows, hw.num_lns + 2, 4)
+    assert hw.occupancy.dtype == numpy.uint8
+    assert (hw.grid[:, 0, 1] == 2).all() and (hw.grid[:, 1, 1] == 1).all()
+    hw.grid[12, 2, 0] = 1
+    assert hw.occupancy[2, 12] == 1
+    hw.occupy(30, 3)
+    assert hw.grid[30, 3, 0] == 1
+    # entrances share the row of their exit and overwrite its flag
+    assert hw.grid[50, 3, 3] == 1 and hw.grid[0, 2, 3] == 1
+    hw.set_toll(hw.tolling_start)
+    assert (hw.grid[:, 1, 3] == hw.etl_price).all()
+    assert numpy.asarray(hw.grid)[30, 3, 0] == 1
+
+def test_ramp_queues():
+    """ Ramps queue vehicles in order, turn them away when full and
+        record how long the served ones waited
+
+    """
+    hw = make_highway()
+    ramp = hw.exits_arr[0]
+    queues = hw.ramps
+    assert ramp.queues is queues
+    hw.ramps.step(0)
+    for vid in range(ramp.max):
+        assert ramp.intake(vid)
+    assert not ramp.intake(99)
+    assert ramp.count == ramp.max
+    assert list(queues.waiting(ramp.index)) == list(range(ramp.max))
+    hw.ramps.step(4)
+    assert ramp.count == ramp.max
+    hw.ramps.step(5)
+    assert ramp.count == 0
+    assert ramp.number_dispensed == ramp.max
+    stats = queues.delay_stats()
+    assert stats['blocked'][ramp.index] == 1
+    assert stats['max_wait'][ramp.index] == 4
+    assert stats['p95_wait'][ramp.index] == 4
+    assert stats['served'].sum() == ramp.max
+
+def test_lane_speeds():
+    """ All lane speeds at once match get_speed, and the moves recorded
+        on the grid give the same lanes, and per vehicle speeds by mile
+
+    """
+    hw = make_highway()
+    hw.vehicle_entered([0, 1, 1, 2])
+    hw.squares_changed(numpy.array([1, 2, 2, 3]), [2, 2, 3, 2])
+    moved = numpy.array([10.0, 24.0, 0.0])
+    speeds = hw.lane_speeds(moved, 1/60.0)
+    for lane in range(hw.num_lns):
+        assert speeds[lane] == hw.get_speed(moved[lane], 1/60.0, lane)
+    failed = False
+    try:
+        hw.lane_speeds(None, 1/60.0)
+    except ValueError:
+        failed = True
+    assert failed
+    hw.track_moves()
+    hw.clear_moves()
+    hw.record_moves(numpy.array([1, 2, 2, 3]), numpy.array([15, 12, 35, 40]), \
+                    numpy.array([10, 14, 10, 0]))
+    assert (hw.lane_speeds(None, 1/60.0) == speeds).all()
+    profile = hw.speed_profile(1/60.0)
+    assert profile.shape == (hw.length, hw.num_lns)
+    assert profile[1, 0] == 60 and profile[1, 1] == 84
+    assert profile[3, 1] == 60 and profile[4, 2] == 0
+    assert profile.sum() == 60 + 84 + 60
+
+def test_segments():
+    """ Density, flow and speed of every mile land in their time step
+
+    """
+    hw = make_highway()
+    assert hw.moved is None
+    hw.track_segments(3)
+    assert hw.moved.shape == hw.occupancy.shape
+    assert hw.segment_speed.shape == (3, hw.length, hw.num_lns)
+    hw.clear_moves()
+    hw.record_moves(numpy.array([2, 2, 3]), numpy.array([12, 18, 12]), \
+                    numpy.array([10, 20, 0]))
+    hw.record_segments(1)
+    assert hw.segment_density[1, 1, 1] == 2 and hw.segment_density[1, 1, 2] == 1
+    assert hw.segment_flow[1, 1, 1] == 180
+    assert hw.segment_speed[1, 1, 1] == 90 and hw.segment_speed[1, 1, 2] == 0
+    assert hw.segment_density[[0, 2]].sum() == 0
+    assert (hw.segment_flow[1] == hw.segment_density[1] * hw.segment_speed[1]).all()
+
+if __name__ == "__main__":
+    test_lane_counts()
+    test_toll_schedule()
+    test_next_occupied()
+    test_ramp_lookup()
+    test_grid_view()
+    test_ramp_queues()
+    test_lane_speeds()
+    test_segments()
+    print("Highway tests passed")
@@ -0,0 +1,283 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Streaming Metrics Files for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: metrics.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - A metrics file holds one record per time step of a simulated day
+#   (scenario, toll, speeds, vehicle counts, ramp queues, throughput),
+#   stored by column: behind a header listing the columns comes a run of
+#   batches, each a row count followed by the values of every column for
+#   those rows
+# - MetricsWriter keeps one batch in fixed size buffers and appends it to
+#   the file when it is full, so its memory does not grow with the day or
+#   with the number of days written
+# - MetricsFile reads the columns back, read_metrics joins the files of
+#   many days
+# - The density, flow and speed of every lane in every mile of a day
+#   (Highway.track_segments) are saved whole at the end of the day with
+#   save_segments, as (time step, mile, lane) arrays
+
+#=======================================================================
+
+import json
+import os
+import numpy
+
+METRICS_MAGIC = b'I405MET1'
+
+def day_columns(highway):
+    """
+    Columns recorded for every time step of a day on a highway
+
+    Method Arguments:
+        - highway : the Highway being recorded
+
+    Returns:
+        - list of (name, dtype, width), width being the number of values
+          per time step (one per lane or per ramp)
+    """
+    lanes = highway.num_lns
+    # tolls are dollars and may have cents, as the 0.75 default min_toll
+    return [('direction', 'S5', 1), ('min_toll', '<f4', 1), \
+            ('max_toll', '<f4', 1), ('replicate', '<i4', 1), \
+            ('time_step', '<i4', 1), ('toll', '<f4', 1), \
+            ('gpl_speed', '<f4', 1), ('etl_speed', '<f4', 1), \
+            ('lane_speed', '<f4', lanes), ('lane_vehicles', '<i4', lanes), \
+            ('vehicles', '<i4', 1), ('arrived', '<i4', 1), \
+            ('exited', '<i4', 1), \
+            ('exit_queue', '<i4', len(highway.exits_arr)), \
+            ('entrance_queue', '<i4', len(highway.entrance_arr))]
+
+def _read_header(f, path):
+    if f.read(len(METRICS_MAGIC)) != METRICS_MAGIC:
+        raise ValueError(path + " is not a metrics file")
+    size = int(numpy.frombuffer(f.read(4), dtype='<u4')[0])
+    header = json.loads(f.read(size).decode())
+    columns = [(name, numpy.dtype(dtype), width) \
+               for name, dtype, width in header['columns']]
+    return columns, len(METRICS_MAGIC) + 4 + size
+
+def _batch_size(columns, rows):
+    return 4 + sum(rows * width * dtype.itemsize \
+                   for name, dtype, width in columns)
+
+def _scan(f, columns, offset):
+    """
+    (offset, rows) of every complete batch after the header
+    """
+    end = os.fstat(f.fileno()).st_size
+    batches = []
+    while offset + 4 <= end:
+        f.seek(offset)
+        rows = int(numpy.frombuffer(f.read(4), dtype='<u4')[0])
+        size = _batch_size(columns, rows)
+        if offset + size > end:
+            # half written batch of an interrupted run
+            break
+        batches.append((offset, rows))
+        offset += size
+    return batches
+
+def _read_batch(f, columns, offset, rows, names=None):
+    f.seek(offset + 4)
+    values = {}
+    for name, dtype, width in columns:
+        size = rows * width * dtype.itemsize
+        if names is not None and name not in names:
+            f.seek(size, os.SEEK_CUR)
+            continue
+        data = numpy.frombuffer(f.read(size), dtype=dtype)
+        values[name] = data if width == 1 else data.reshape(rows, width)
+    return values
+
+class MetricsWriter:
+    def __init__(self, columns, path, batch_size=240, resume_at=0):
+        """ Append only writer of per time step records
+
+        Method Arguments:
+            - columns : list of (name, dtype, width), see day_columns
+            - path : file to write
+            - batch_size : number of records held before they are written
+            - resume_at : time step a resumed day restarts from; an existing
+              file keeps its records before it and is appended to
+        """
+        self.path = path
+        self.columns = [(name, numpy.dtype(dtype), width) \
+                        for name, dtype, width in columns]
+        self.batch_size = batch_size
+        self.buffers = {name: numpy.zeros((batch_size, width), dtype=dtype) \
+                        for name, dtype, width in self.columns}
+        self.count = 0
+        folder = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        if resume_at > 0 and os.path.exists(path):
+            self._resume(resume_at)
+            return
+        header = json.dumps({'columns': [[name, dtype.str, width] \
+                                         for name, dtype, width in self.columns]})
+        self.file = open(path, 'wb')
+        self.file.write(METRICS_MAGIC)
+        self.file.write(numpy.uint32(len(header)).tobytes())
+        self.file.write(header.encode())
+
+    def _resume(self, resume_at):
+        """
+        Drop the records from resume_at on, and any half written batch
+        """
+        self.file = open(self.path, 'r+b')
+        columns, offset = _read_header(self.file, self.path)
+        if columns != self.columns:
+            raise ValueError(self.path + " holds different metrics columns")
+        end = offset
+        for offset, rows in _scan(self.file, columns, offset):
+            batch = _read_batch(self.file, columns, offset, rows)
+            keep = int(numpy.searchsorted(batch['time_step'], resume_at))
+            if keep < rows:
+                # the batch runs past the checkpoint, write its start again
+                for name, values in batch.items():
+                    self.buffers[name][:keep] = \
+                        values[:keep].reshape(keep, -1)
+                self.count = keep
+                break
+            end = offset + _batch_size(columns, rows)
+        self.file.truncate(end)
+        self.file.seek(end)
+
+    def append(self, **values):
+        """
+        Add the record of one time step, one keyword per column
+        """
+        for name in self.buffers:
+            self.buffers[name][self.count] = values[name]
+        self.count += 1
+        if self.count == self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the records held so far as one batch
+        """
+        if self.count == 0:
+            return
+        self.file.write(numpy.uint32(self.count).tobytes())
+        for name, dtype, width in self.columns:
+            self.file.write(self.buffers[name][:self.count].tobytes())
+        self.file.flush()
+        self.count = 0
+
+    def close(self):
+        """
+        Write the last records and close the file
+        """
+        self.flush()
+        self.file.close()
+
+class MetricsFile:
+    def __init__(self, path):
+        """ Reader for a file written by MetricsWriter
+
+        Method Arguments:
+            - path : metrics file to read
+
+        Member Variables:
+            - columns : list of (name, dtype, width) in the file
+            - batches : (offset, rows) of every complete batch
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.columns, offset = _read_header(f, path)
+            self.batches = _scan(f, self.columns, offset)
+
+    def __len__(self):
+        return sum(rows for offset, rows in self.batches)
+
+    def read(self, names=None):
+        """
+        Values of columns for every record
+
+        Method Arguments:
+            - names : columns to read, None reads them all
+
+        Returns:
+            - dict of arrays, one row per time step (2D for columns with
+              more than one value per step)
+        """
+        parts = {}
+        with open(self.path, 'rb') as f:
+            for offset, rows in self.batches:
+                batch = _read_batch(f, self.columns, offset, rows, names)
+                for name, values in batch.items():
+                    parts.setdefault(name, []).append(values)
+        return {name: numpy.concatenate(parts[name]) if name in parts else \
+                numpy.zeros((0,) if width == 1 else (0, width), dtype=dtype) \
+                for name, dtype, width in self.columns \
+                if names is None or name in names}
+
+    def to_frame(self, names=None):
+        """
+        The records as a pandas DataFrame, one column per lane or ramp for
+        the columns with more than one value per step (lane_speed_0, ...)
+        """
+        import pandas
+        data = {}
+        for name, values in self.read(names).items():
+            if values.ndim == 1:
+                data[name] = values
+            else:
+                for i in range(values.shape[1]):
+                    data[name + '_' + str(i)] = values[:, i]
+        return pandas.DataFrame(data)
+
+def read_metrics(paths, names=None):
+    """
+    Join the records of many metrics files, e.g. all the days of a sweep
+
+    Method Arguments:
+        - paths : metrics files to read
+        - names : columns to read, None reads them all
+
+    Returns:
+        - dict of arrays as MetricsFile.read
+    """
+    parts = [MetricsFile(path).read(names) for path in paths]
+    if not parts:
+        return {}
+    return {name: numpy.concatenate([part[name] for part in parts]) \
+            for name in parts[0]}
+
+def save_segments(highway, path):
+    """
+    Write the segment arrays of a highway, see Highway.track_segments
+
+    Method Arguments:
+        - highway : the Highway that recorded them
+        - path : file to write (.npz)
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    numpy.savez_compressed(path, density=highway.segment_density, \
+                           flow=highway.segment_flow, \
+                           speed=highway.segment_speed, \
+                           exits=numpy.array([ramp.y for ramp in \
+                                              highway.exits_arr]) / \
+                                 highway.grid_per_mile)
+
+def read_segments(path):
+    """
+    Read the segment arrays written by save_segments
+
+    Returns:
+        - dict of density, flow and speed (time step, mile, lane) arrays,
+          and the mile of every ramp of highway.exits_arr
+    """
+    with numpy.load(path) as data:
+        return {name: data[name] for name in data.files}
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the metrics files.
+
+    Checks records read back as written and a resumed day continues its
+    file without gaps.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import os
+import shutil
+import tempfile
+
+import numpy
+
+import metrics
+from fixtures import make_highway
+
+COLUMNS = [('time_step', '<i4', 1), ('speed', '<f4', 1), \
+           ('lane_vehicles', '<i4', 3)]
+
+def write_steps(writer, steps):
+    """ Appends one record per time step, every value built from it
+
+    """
+    for t in steps:
+        writer.append(time_step=t, speed=t / 2.0, \
+                      lane_vehicles=[t, t + 1, t + 2])
+
+def test_resume():
+    """ Resuming mid batch keeps the records before the resume point and
+        drops the rest, including a half written batch
+
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, 'metrics_0.cols')
+        writer = metrics.MetricsWriter(COLUMNS, path, batch_size=4)
+        write_steps(writer, range(10))
+        writer.close()
+        saved = metrics.MetricsFile(path)
+        assert [rows for offset, rows in saved.batches] == [4, 4, 2]
+        assert list(saved.read(['time_step'])['time_step']) == list(range(10))
+        # an interrupted run leaves the start of a batch behind
+        with open(path, 'ab') as f:
+            f.write(numpy.uint32(4).tobytes())
+            f.write(numpy.arange(3, dtype='<i4').tobytes())
+        assert len(metrics.MetricsFile(path)) == 10
+        writer = metrics.MetricsWriter(COLUMNS, path, batch_size=4, \
+                                       resume_at=6)
+        assert writer.count == 2
+        write_steps(writer, range(6, 12))
+        writer.close()
+        values = metrics.MetricsFile(path).read()
+        steps = numpy.arange(12)
+        assert list(values['time_step']) == list(steps)
+        assert (values['speed'] == steps / 2.0).all()
+        assert values['lane_vehicles'].shape == (12, 3)
+        assert (values['lane_vehicles'][:, 2] == steps + 2).all()
+    finally:
+        shutil.rmtree(folder)
+
+def test_day_tolls():
+    """ Tolls of a day keep their cents
+
+    """
+    folder = tempfile.mkdtemp()
+    try:
+        hw = make_highway()
+        path = os.path.join(folder, 'metrics_0.cols')
+        writer = metrics.MetricsWriter(metrics.day_columns(hw), path)
+        values = {name: 0 for name, dtype, width in metrics.day_columns(hw)}
+        values.update(direction='north', min_toll=0.75, max_toll=5, toll=1.25)
+        writer.append(**values)
+        writer.close()
+        values = metrics.MetricsFile(path).read()
+        assert list(values['min_toll']) == [0.75]
+        assert list(values['max_toll']) == [5.0]
+        assert list(values['toll']) == [1.25]
+        assert list(values['direction']) == [b'north']
+    finally:
+        shutil.rmtree(folder)
+
+if __name__ == "__main__":
+    test_resume()
+    test_day_tolls()
+    print("Metrics tests passed")
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Samples whole populations of drivers at once.
+
+    The on-ramp, income class, income range, Good-to-Go!, occupancy,
+    commuter and hurry distributions used by the Car constructor are
+    turned into cumulative tables once, when the module is imported,
+    so N driver profiles cost a handful of vectorized draws.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+# - See car.py for where each distribution comes from
+#=======================================================================
+
+import numpy as np
+from Income_Data import Income_Data
+
+# shared, read-only copy of the income tables
+INCOME_DATA = Income_Data()
+
+INCOME_CLASSES = ['low', 'low mid', 'mid', 'upper mid', 'upper']
+
+ON_RAMPS = {'South': ['I5 North', 'I5 South1', 'I5 South2', 'Canyon Park', \
+                      'WA_522'], \
+            'North': ['Bellevue 4th St', 'Redmond Way', 'Central Way', \
+                      'WA 527']}
+# populations of the city behind each on-ramp
+RAMP_POPS = {'South': [110079, 38273, 21337, 45533, 45533], \
+             'North': [144444, 64291, 88630, 45533]}
+RAMP_CDF = {d: np.cumsum(p) / np.sum(p) for d, p in RAMP_POPS.items()}
+RAMP_CITIES = {'South': [INCOME_DATA.on_ramps_south[r] \
+                         for r in ON_RAMPS['South']], \
+               'North': [INCOME_DATA.on_ramps_north[r] \
+                         for r in ON_RAMPS['North']]}
+
+_CITY_INCOME = {'Everett': INCOME_DATA.everett_income, \
+                'Lynnwood': INCOME_DATA.lynnwood_income, \
+                'Mountlake Terrace': INCOME_DATA.mterrace_income, \
+                'Bothell': INCOME_DATA.bothell_income, \
+                'Bellevue': INCOME_DATA.bellevue_income, \
+                'Redmond': INCOME_DATA.redmond_income, \
+                'Kirkland': INCOME_DATA.kirkland_income}
+# [ramp, income class, (low, high)] for each direction
+INCOME_BOUNDS = {d: np.array([[_CITY_INCOME[c][k] for k in INCOME_CLASSES] \
+                              for c in cities]) \
+                 for d, cities in RAMP_CITIES.items()}
+# the last class takes whatever is left over
+CLASS_CDF = np.cumsum([INCOME_DATA.income_breakdown[k] / 100.0 \
+                       for k in INCOME_CLASSES[:-1]])
+
+POP_VALUES = np.array([1., 2., 3., 4., 5.])
+POP_CDF = np.array([0.764, 0.884, 0.944, 0.974, 1])
+GTG_PASS_PROB = 0.5
+FREQ_COMM_PROB = 0.8
+MAY_SPEED_PROB = .514
+HURRY_PROB = .316
+
+class DriverProfiles(object):
+    """ A sampled population of drivers, one array entry per driver
+
+        Data fields:
+            direction:     'North' or 'South'
+            on_ramp:       index into ON_RAMPS[direction]
+            income_class:  index into INCOME_CLASSES
+            income:        driver income
+            has_gtg:       whether the driver has a Good-to-Go! pass
+            pop:           number of people in the car
+            freq_commuter: whether the driver commutes frequently
+            in_a_hurry:    whether the driver is in a hurry
+    """
+    def __init__(self, direction, on_ramp, income_class, income, has_gtg, \
+                 pop, freq_commuter, in_a_hurry):
+        self.direction = direction
+        self.on_ramp = on_ramp
+        self.income_class = income_class
+        self.income = income
+        self.has_gtg = has_gtg
+        self.pop = pop
+        self.freq_commuter = freq_commuter
+        self.in_a_hurry = in_a_hurry
+
+    def __len__(self):
+        return np.size(self.income)
+
+    def profile(self, i):
+        """ Attributes of one driver, as accepted by Car(profile=...)
+
+            Parameters:
+                i: index of the driver (into the flattened population)
+        """
+        ramp = ON_RAMPS[self.direction][self.on_ramp.flat[i]]
+        return {'on_ramp': ramp, \
+                'city': RAMP_CITIES[self.direction][self.on_ramp.flat[i]], \
+                'income_class': INCOME_CLASSES[self.income_class.flat[i]], \
+                'income': int(self.income.flat[i]), \
+                'has_gtg': bool(self.has_gtg.flat[i]), \
+                'pop': float(self.pop.flat[i]), \
+                'freq_commuter': bool(self.freq_commuter.flat[i]), \
+                'in_a_hurry': bool(self.in_a_hurry.flat[i])}
+
+    def decision_inputs(self):
+        """ Driver arrays named as the arguments of
+            etl_decision.want_to_move_to_etl_batch
+        """
+        return {'income': self.income, \
+                'north': np.full(np.shape(self.income), \
+                                 self.direction == 'North'), \
+                'freq_commuter': self.freq_commuter, \
+                'has_gtg': self.has_gtg, \
+                'in_a_hurry': self.in_a_hurry}
+
+def sample_profiles(shape, direction, rng=None):
+    """ Samples a population of drivers in one vectorized call
+
+        Parameters:
+            shape: number of drivers, or shape of the population array
+            direction: 'North' or 'South'
+            rng: numpy Generator to draw from
+        Returns:
+            DriverProfiles
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    shape = tuple(np.atleast_1d(shape))
+    draws = rng.random((8,) + shape)
+    cdf = RAMP_CDF[direction]
+    on_ramp = np.minimum(np.searchsorted(cdf, draws[0]), len(cdf) - 1)
+    income_class = np.searchsorted(CLASS_CDF, draws[1])
+    bounds = INCOME_BOUNDS[direction][on_ramp, income_class]
+    low = bounds[..., 0]
+    high = bounds[..., 1]
+    # same as randint(low, high)
+    income = low + np.floor(draws[2] * (high - low)).astype(int)
+    pop = POP_VALUES[np.searchsorted(POP_CDF, draws[3], side='right')]
+    # rule out drivers who would not speed, then the habitual speeders
+    in_a_hurry = (draws[6] < MAY_SPEED_PROB) & (draws[7] < HURRY_PROB)
+    return DriverProfiles(direction, on_ramp, income_class, income, \
+                          draws[4] < GTG_PASS_PROB, pop, \
+                          draws[5] < FREQ_COMM_PROB, in_a_hurry)
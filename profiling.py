@@ -0,0 +1,230 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Phase Timing for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: profiling.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - A PhaseTimer splits every time step into phases with lap(): each
+#   call charges the time since the previous one to the phase it names
+# - Methods registered with instrument() (e.g. the sub-phases of
+#   Car.move) are timed too, but only while a PhaseTimer is active in
+#   the calling thread; the timing wrappers are put on the classes when
+#   the first timer starts and taken off when the last one stops, so a
+#   run without timers calls the plain methods
+# - NULL_TIMER has the same methods and does nothing, so the simulation
+#   loop can call it unconditionally
+
+#=======================================================================
+
+import functools
+import json
+import threading
+import time
+
+#(class, method name) pairs timed while a timer is active
+_registered = []
+_local = threading.local()
+_lock = threading.Lock()
+_active_count = 0
+
+def instrument(cls, *names):
+    """
+    Register methods of a class to be timed while a PhaseTimer is active
+
+    Method Arguments:
+        - cls : class the methods belong to
+        - names : names of the methods, recorded as 'Class.method'
+    """
+    for name in names:
+        if (cls, name) not in _registered:
+            _registered.append((cls, name))
+
+def _timed(cls, name, method):
+    """
+    Wrapper around a method that charges its wall time to the thread's timer
+    """
+    label = cls.__name__ + '.' + name
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        timer = getattr(_local, 'timer', None)
+        if timer is None:
+            return method(*args, **kwargs)
+        began = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timer.add(label, time.perf_counter() - began, nested=True)
+    wrapper._untimed = method
+    return wrapper
+
+def _install():
+    for cls, name in _registered:
+        method = cls.__dict__[name]
+        if not hasattr(method, '_untimed'):
+            setattr(cls, name, _timed(cls, name, method))
+
+def _uninstall():
+    for cls, name in _registered:
+        method = cls.__dict__[name]
+        if hasattr(method, '_untimed'):
+            setattr(cls, name, method._untimed)
+
+class PhaseTimer(object):
+    """ Wall time and call counts of the phases of a simulated day
+
+        Data fields:
+            seconds:  total seconds of every phase
+            calls:    number of times every phase was timed
+            per_step: seconds of every phase in every time step
+            nested:   names of the phases timed inside other phases
+                      (the instrumented methods)
+            steps:    number of time steps recorded
+    """
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self.per_step = {}
+        self.nested = set()
+        self.steps = 0
+        self._step = {}
+        self._last = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        """
+        Make this the timer of the calling thread and time the
+        instrumented methods
+        """
+        global _active_count
+        _local.timer = self
+        with _lock:
+            if _active_count == 0:
+                _install()
+            _active_count += 1
+
+    def stop(self):
+        """
+        Stop timing in the calling thread
+        """
+        global _active_count
+        if getattr(_local, 'timer', None) is not self:
+            return
+        _local.timer = None
+        with _lock:
+            _active_count -= 1
+            if _active_count == 0:
+                _uninstall()
+
+    def add(self, name, seconds, nested=False):
+        """
+        Charge seconds to a phase
+
+        Method Arguments:
+            - name : name of the phase
+            - seconds : wall time to add
+            - nested : True if the phase runs inside another phase
+        """
+        if name not in self.seconds:
+            self.seconds[name] = 0.0
+            self.calls[name] = 0
+            self.per_step[name] = [0.0] * self.steps
+            if nested:
+                self.nested.add(name)
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+        self._step[name] = self._step.get(name, 0.0) + seconds
+
+    def begin_step(self):
+        """
+        Start a time step, the next lap is measured from here
+        """
+        self._step = {}
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        """
+        Charge the time since the previous lap (or begin_step) to a phase
+        """
+        now = time.perf_counter()
+        self.add(name, now - self._last)
+        self._last = now
+
+    def end_step(self):
+        """
+        Finish a time step and record the seconds of its phases
+        """
+        for name in self.per_step:
+            self.per_step[name].append(self._step.get(name, 0.0))
+        self.steps += 1
+        self._step = {}
+
+    def summary(self):
+        """
+        Table of the phases, slowest first
+
+        Returns:
+            - string with the total seconds, calls, microseconds per call
+              and share of the time steps of every phase; nested phases
+              are indented under the loop phases and their share is of
+              the whole step too
+        """
+        total = sum(self.seconds[name] for name in self.seconds \
+                    if name not in self.nested)
+        lines = ["%-28s %10s %10s %10s %7s" % \
+                 ('phase', 'seconds', 'calls', 'us/call', 'share')]
+        for nested in (False, True):
+            names = [name for name in self.seconds \
+                     if (name in self.nested) == nested]
+            for name in sorted(names, key=lambda n: -self.seconds[n]):
+                lines.append("%-28s %10.3f %10d %10.1f %6.1f%%" % \
+                    (('  ' if nested else '') + name, self.seconds[name], \
+                     self.calls[name], \
+                     1e6 * self.seconds[name] / self.calls[name], \
+                     100.0 * self.seconds[name] / total if total else 0.0))
+        return '\n'.join(lines)
+
+    def export(self, path):
+        """
+        Write the totals, calls and per step seconds of every phase as JSON
+
+        Method Arguments:
+            - path : file to write
+        """
+        with open(path, 'w') as f:
+            json.dump({'steps': self.steps, \
+                       'phases': {name: {'seconds': self.seconds[name], \
+                                         'calls': self.calls[name], \
+                                         'nested': name in self.nested, \
+                                         'per_step': self.per_step[name]} \
+                                  for name in self.seconds}}, f)
+
+class _NullTimer(object):
+    """ Stand in for a PhaseTimer when timing is off """
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def begin_step(self):
+        pass
+
+    def lap(self, name):
+        pass
+
+    def end_step(self):
+        pass
+
+NULL_TIMER = _NullTimer()
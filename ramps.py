@@ -0,0 +1,238 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Ramp Queues for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: ramps.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - RampQueues holds the queues of every ramp of a highway in arrays:
+#   queue length, capacity and number served per service of every ramp,
+#   and a ring buffer per ramp of the ids of the waiting vehicles and the
+#   time step they joined
+# - Every interval minutes, step() serves all the ramps at once
+#   and adds the waits of the vehicles served to the delay statistics
+# - Exit and Enter objects keep their count / max / intake / deplete
+#   interface on top of their row of a RampQueues (RampView)
+
+#=======================================================================
+
+import numpy
+
+#Longest wait (minutes) counted separately by the wait histogram, longer
+#waits are counted in its last bin
+MAX_TRACKED_WAIT = 120
+
+class RampQueues(object):
+    """ Queues of a set of ramps
+
+        Data fields:
+            length:      number of vehicles waiting at every ramp
+            capacity:    most vehicles every ramp holds
+            service:     most vehicles served at every ramp per service
+            interval:    minutes between services
+            head:        ring buffer slot of the first waiting vehicle
+            ids:         (ramps, max capacity) ids of the waiting vehicles
+            since:       (ramps, max capacity) time step they joined
+            served:      vehicles served at every ramp so far
+            blocked:     intakes turned away from every full ramp so far
+            wait_total:  minutes waited by the vehicles served
+            wait_max:    longest wait of a vehicle served
+            wait_hist:   (ramps, MAX_TRACKED_WAIT + 1) count of served
+                         vehicles by minutes waited
+            clock:       time step given to vehicles joining a queue
+    """
+    def __init__(self, capacity, service, interval=5):
+        capacity = numpy.asarray(capacity, dtype=numpy.int64)
+        n = len(capacity)
+        width = int(capacity.max()) if n else 0
+        self.capacity = capacity
+        self.service = numpy.asarray(service, dtype=numpy.int64)
+        self.interval = interval
+        self.length = numpy.zeros(n, dtype=numpy.int64)
+        self.head = numpy.zeros(n, dtype=numpy.int64)
+        self.ids = numpy.full((n, width), -1, dtype=numpy.int64)
+        self.since = numpy.zeros((n, width), dtype=numpy.int64)
+        self.served = numpy.zeros(n, dtype=numpy.int64)
+        self.blocked = numpy.zeros(n, dtype=numpy.int64)
+        self.wait_total = numpy.zeros(n, dtype=numpy.int64)
+        self.wait_max = numpy.zeros(n, dtype=numpy.int64)
+        self.wait_hist = numpy.zeros((n, MAX_TRACKED_WAIT + 1), dtype=numpy.int64)
+        self.clock = 0
+
+    @classmethod
+    def attach(cls, ramps, interval=5):
+        """
+        Queues for a list of ramps, each ramp then reads and writes its
+        row of them
+
+        Method Arguments:
+            - ramps : Exit and Enter objects
+            - interval : minutes between services
+        """
+        queues = cls([ramp.max for ramp in ramps], \
+                     [ramp.dispense_num for ramp in ramps], interval)
+        for i, ramp in enumerate(ramps):
+            queues.length[i] = ramp.count
+            queues.served[i] = ramp.number_dispensed
+            ramp.queues = queues
+            ramp.index = i
+        return queues
+
+    def __len__(self):
+        return len(self.length)
+
+    def intake(self, ramp, vehicle_id=-1):
+        """
+        Put a vehicle at the back of a ramp's queue
+
+        Method Arguments:
+            - ramp : index of the ramp
+            - vehicle_id : id of the vehicle
+
+        Returns:
+            - bool, False if the ramp was full
+        """
+        if self.length[ramp] >= self.capacity[ramp]:
+            self.blocked[ramp] += 1
+            return False
+        slot = (self.head[ramp] + self.length[ramp]) % self.capacity[ramp]
+        self.ids[ramp, slot] = vehicle_id
+        self.since[ramp, slot] = self.clock
+        self.length[ramp] += 1
+        return True
+
+    def serve(self, time_step, ramps=None):
+        """
+        Let the front of the queues go, up to service vehicles per ramp
+
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+            - ramps : optional indices of the ramps to serve, default all
+
+        Returns:
+            - number of vehicles served at every ramp
+        """
+        count = numpy.minimum(self.length, self.service)
+        if ramps is not None:
+            keep = numpy.zeros(len(count), dtype=bool)
+            keep[ramps] = True
+            count[~keep] = 0
+        most = int(count.max()) if len(count) else 0
+        if most == 0:
+            return count
+        offset = numpy.arange(most)
+        rows = numpy.arange(len(count))[:, None]
+        slots = (self.head[:, None] + offset) % self.capacity[:, None]
+        left = offset < count[:, None]
+        waits = time_step - self.since[rows, slots]
+        self.wait_total += numpy.where(left, waits, 0).sum(axis=1)
+        self.wait_max = numpy.maximum(self.wait_max, \
+                                      numpy.where(left, waits, 0).max(axis=1))
+        numpy.add.at(self.wait_hist, (numpy.broadcast_to(rows, left.shape)[left], \
+                                      numpy.minimum(waits[left], MAX_TRACKED_WAIT)), 1)
+        self.head = (self.head + count) % self.capacity
+        self.length -= count
+        self.served += count
+        return count
+
+    def step(self, time_step):
+        """
+        End a time step: serve every ramp if a service is due, and date
+        the vehicles joining from now on with the next time step
+
+        Method Arguments:
+            - time_step : number representing the time step in the sequence
+        """
+        if time_step % self.interval == 0:
+            self.serve(time_step)
+        self.clock = time_step + 1
+
+    def waiting(self, ramp):
+        """
+        Ids of the vehicles waiting at a ramp, front first
+        """
+        slots = (self.head[ramp] + numpy.arange(self.length[ramp])) % \
+                self.capacity[ramp]
+        return self.ids[ramp, slots]
+
+    def wait_percentile(self, q):
+        """
+        Wait (minutes) at or below which q percent of the vehicles served
+        at every ramp waited, -1 where none were served yet
+        """
+        cum = numpy.cumsum(self.wait_hist, axis=1)
+        total = cum[:, -1]
+        need = numpy.ceil(total * q / 100.0)
+        result = numpy.argmax(cum >= numpy.maximum(need, 1)[:, None], axis=1)
+        return numpy.where(total > 0, result, -1)
+
+    def delay_stats(self):
+        """
+        Queue delay statistics of every ramp
+
+        Returns:
+            - dict of arrays with one entry per ramp: served, blocked,
+              waiting, mean_wait, p95_wait and max_wait (minutes)
+        """
+        served = numpy.maximum(self.served, 1)
+        return {'served': self.served.copy(), 'blocked': self.blocked.copy(), \
+                'waiting': self.length.copy(), \
+                'mean_wait': numpy.where(self.served > 0, \
+                                         self.wait_total / served, 0.0), \
+                'p95_wait': self.wait_percentile(95), \
+                'max_wait': self.wait_max.copy()}
+
+class RampView(object):
+    """ count / max / intake / deplete of one ramp of a RampQueues
+
+        A ramp starts with a queue of its own (queues, index); once the
+        highway is built RampQueues.attach moves it into the shared one.
+    """
+    def _own_queue(self, max_capacity):
+        self.queues = RampQueues([max_capacity], [self.dispense_num])
+        self.index = 0
+
+    @property
+    def count(self):
+        return int(self.queues.length[self.index])
+
+    @property
+    def max(self):
+        return int(self.queues.capacity[self.index])
+
+    @property
+    def number_dispensed(self):
+        return int(self.queues.served[self.index])
+
+    def intake(self, veh):
+        """
+        Take in vehicles
+
+        Method arguments:
+            - veh : the vehicle to take in, or its id
+
+        Return Values:
+            - Bool representing if the intake was successful
+        """
+        if isinstance(veh, (int, numpy.integer)):
+            vehicle_id = int(veh)
+        else:
+            vehicle_id = getattr(veh, 'id', -1)
+        return self.queues.intake(self.index, vehicle_id)
+
+    def deplete(self):
+        """
+        Push out vehicles
+
+        Method arguments:
+            - none
+
+        Return Values:
+            - none
+        """
+        self.queues.serve(self.queues.clock, [self.index])
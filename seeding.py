@@ -0,0 +1,96 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Random Number Streams for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: seeding.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - Every seed used by a run is derived from one root seed and a key
+#   naming what it is for (a scenario, a direction, a component), with
+#   numpy.random.SeedSequence. Streams with different keys are
+#   independent, and the stream of a key does not depend on how many
+#   other scenarios or workers there are, so runs can be spread over
+#   processes in any order and still repeat bit for bit.
+
+#=======================================================================
+
+import zlib
+import numpy
+
+#Components of a simulated day that draw random numbers
+COMPONENTS = ('arrivals', 'drivers', 'decisions')
+
+def _key_part(part):
+    """
+    Turn one part of a key (int or string) into a SeedSequence spawn key
+
+    Whole numbers are their own key (2 and 2.0 give the same one), other
+    numbers are hashed from their repr, so 0.5 and 0.75 are not cut to 0
+    """
+    if isinstance(part, str):
+        return zlib.crc32(part.encode())
+    if part != int(part):
+        return zlib.crc32(repr(float(part)).encode())
+    return int(part)
+
+def root_entropy(seed=None):
+    """
+    Entropy of a root seed, drawing a fresh one from the OS for None
+
+    Method Arguments:
+        - seed : int seed or None
+    """
+    return numpy.random.SeedSequence(seed).entropy
+
+def derive(seed, *key):
+    """
+    Seed for one part of a run
+
+    Method Arguments:
+        - seed : root seed (int)
+        - key : ints or strings naming the part, e.g. (min_toll,
+          max_toll, replicate) for a scenario or 'north' for a direction
+
+    Returns:
+        - int seed, the same for the same root seed and key
+    """
+    seq = numpy.random.SeedSequence(seed, spawn_key=tuple(_key_part(k) \
+                                                          for k in key))
+    return int(seq.generate_state(1)[0])
+
+class Streams(object):
+    """ Independent numpy Generators for the components of one run
+
+        Data fields:
+            seed:       root seed of the run (None draws one from the OS)
+            generators: Generator of every component used so far
+
+        streams['arrivals'] gives the Generator of a component; it is
+        created the first time it is asked for.
+    """
+    def __init__(self, seed=None):
+        self.seed = root_entropy(seed)
+        self.generators = {}
+
+    def __getitem__(self, component):
+        if component not in self.generators:
+            self.generators[component] = \
+                numpy.random.default_rng(derive(self.seed, component))
+        return self.generators[component]
+
+def integers(rng, low, high):
+    """
+    Random int in [low, high) from a Generator or the legacy numpy.random
+
+    Method Arguments:
+        - rng : numpy Generator, or the numpy.random module
+        - low, high : bounds of the draw
+    """
+    if isinstance(rng, numpy.random.Generator):
+        return int(rng.integers(low, high))
+    return rng.randint(low, high)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the random number streams.
+
+    Checks every key gives its own seed and the same key the same one.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import numpy
+
+import seeding
+
+def test_keys():
+    """ Seeds follow their key, whole numbers match their ints and
+        fractions get seeds of their own
+
+    """
+    assert seeding.derive(7, 2, 5, 0) == seeding.derive(7, 2, 5, 0)
+    assert seeding.derive(7, 2.0, numpy.int64(5), 0) == seeding.derive(7, 2, 5, 0)
+    assert seeding.derive(7, 'north') != seeding.derive(7, 'south')
+    assert seeding.derive(7, 2, 5, 0) != seeding.derive(7, 2, 5, 1)
+    fractions = [seeding.derive(7, part, 5, 0) for part in (0, 0.5, 0.75)]
+    assert len(set(fractions)) == 3
+    assert seeding.derive(7, 0.75, 5, 0) == fractions[2]
+    assert seeding.derive(7, numpy.float32(0.75), 5, 0) == fractions[2]
+
+def test_streams():
+    """ Streams of one seed repeat, and their components differ
+
+    """
+    first = seeding.Streams(3)
+    second = seeding.Streams(3)
+    draws = first['arrivals'].random(4)
+    assert (draws == second['arrivals'].random(4)).all()
+    assert (draws != second['drivers'].random(4)).all()
+
+if __name__ == "__main__":
+    test_keys()
+    test_streams()
+    print("Seeding tests passed")
@@ -0,0 +1,148 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Parallel Toll Sweep for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: sweep.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - Every (min_toll, max_toll, replicate) scenario is independent, so
+#   each one is handed to its own worker process and the results are
+#   merged back together here
+# - A scenario is a day in both directions of the corridor, as in the
+#   serial loop of ETL_SIM.py; the worker runs the directions one after
+#   the other, since pool workers cannot start processes of their own
+# - With a checkpoint folder, finished scenarios are recorded as they
+#   come in and every day saves its own time step checkpoints, so a
+#   sweep that is started again skips what is done and resumes the rest
+
+#=======================================================================
+
+import multiprocessing
+import numpy
+import os
+
+import checkpoint
+import ETL_SIM
+import seeding
+
+SWEEP_CHECKPOINT = 'sweep.ckpt'
+
+def scenario_list(min_price, max_price, sim_number):
+    """
+    Build the list of scenarios covered by a sweep
+
+    Method Arguments:
+        - min_price : number of minimum tolls to try (range from 0)
+        - max_price : number of maximum tolls to try (range from 0)
+        - sim_number : number of replicates for each toll range
+
+    Returns:
+        - list of (min_toll, max_toll, replicate) tuples, in the same
+          order as the serial loop in ETL_SIM.py
+    """
+    scenarios = []
+    for m in range(min_price):
+        for n in range(m, max_price):
+            for c in range(sim_number):
+                scenarios.append((m, n, c))
+    return scenarios
+
+def scenario_seeds(scenarios, seed=None):
+    """
+    Derive an independent seed for every scenario
+
+    Method Arguments:
+        - scenarios : list of (min_toll, max_toll, replicate) tuples
+        - seed : optional root seed, None draws one from the OS
+
+    Returns:
+        - list of ints, one per scenario; the seed of a scenario only
+          depends on the root seed and its (min_toll, max_toll, replicate)
+    """
+    root = seeding.root_entropy(seed)
+    return [seeding.derive(root, *key) for key in scenarios]
+
+def _run_one(args):
+    """
+    Worker entry point, runs a single scenario in every direction
+
+    Returns:
+        - (min_toll, max_toll, replicate), vehicle-minutes at each ETL
+          price summed over the directions, and a dict keyed by direction
+          of the (gpl_speeds, etl_speeds) lists
+    """
+    m, n, c, seed, checkpoint_folder = args
+    days = ETL_SIM.run_corridor(m, n, c, seed, concurrent=False, \
+                                checkpoint_folder=checkpoint_folder)
+    money = numpy.zeros(11)
+    speeds = {}
+    for direct, (day_money, speed_g, speed_e) in days.items():
+        money += day_money
+        speeds[direct] = (speed_g, speed_e)
+    return (m, n, c), money, speeds
+
+def run_sweep(min_price=ETL_SIM.min_price, max_price=ETL_SIM.max_price, \
+              sim_number=ETL_SIM.sim_number, processes=None, seed=None, \
+              checkpoint_folder=None):
+    """
+    Run every scenario of a toll sweep on a process pool
+
+    Method Arguments:
+        - min_price : number of minimum tolls to try (range from 0)
+        - max_price : number of maximum tolls to try (range from 0)
+        - sim_number : number of replicates for each toll range
+        - processes : number of worker processes, None uses every core
+        - seed : optional root seed so a sweep can be repeated exactly
+        - checkpoint_folder : optional folder to record progress in; a
+          sweep started again with the same folder resumes from it
+
+    Returns:
+        - time_vs_money : vehicle-minutes at each ETL price summed over
+          every scenario and direction
+        - speeds : dict keyed by (min_toll, max_toll, replicate, direction)
+          holding the (gpl_speeds, etl_speeds) lists of that day
+    """
+    scenarios = scenario_list(min_price, max_price, sim_number)
+    done = {}
+    path = None
+    if checkpoint_folder is not None:
+        path = os.path.join(checkpoint_folder, SWEEP_CHECKPOINT)
+        state = checkpoint.load(path)
+        if state is not None:
+            if state['scenarios'] != scenarios:
+                raise ValueError(path + " belongs to a different sweep")
+            # the seeds of the unfinished scenarios must not change
+            seed = state['seed']
+            done = state['done']
+        elif seed is None:
+            seed = seeding.root_entropy()
+    seeds = scenario_seeds(scenarios, seed)
+    jobs = [(m, n, c, s, checkpoint_folder) \
+            for (m, n, c), s in zip(scenarios, seeds) if (m, n, c) not in done]
+    if jobs:
+        with multiprocessing.Pool(processes) as pool:
+            # whole days are long and uneven, so hand them out one at a time
+            for key, money, day_speeds in \
+            pool.imap_unordered(_run_one, jobs, chunksize=1):
+                done[key] = (money, day_speeds)
+                if path is not None:
+                    checkpoint.save(path, {'scenarios': scenarios, \
+                                           'seed': seed, 'done': done})
+    time_vs_money = numpy.zeros(11)
+    speeds = {}
+    # keep the same ordering the serial loop would have produced
+    for key in scenarios:
+        money, day_speeds = done[key]
+        time_vs_money += money
+        for direct, day in day_speeds.items():
+            speeds[key + (direct,)] = day
+    return time_vs_money, speeds
+
+if __name__ == "__main__":
+    time_vs_money, speeds = run_sweep()
+    print(time_vs_money)
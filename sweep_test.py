@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the parallel toll sweep.
+
+    Checks the sweep gives the same results as running its scenarios
+    one after the other.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import numpy
+
+import ETL_SIM
+import sweep
+
+def test_matches_serial():
+    """ The sweep sums both directions of every scenario, as the serial
+        loop does, and keeps the speeds of every day
+
+    """
+    saved = (ETL_SIM.time_range, ETL_SIM.frame_mode, ETL_SIM.record_metrics)
+    ETL_SIM.time_range = 60
+    ETL_SIM.frame_mode = 'none'
+    ETL_SIM.record_metrics = False
+    try:
+        time_vs_money, speeds = sweep.run_sweep(1, 2, 1, processes=1, seed=5)
+        scenarios = sweep.scenario_list(1, 2, 1)
+        serial = numpy.zeros(11)
+        days = {}
+        for (m, n, c), seed in zip(scenarios, \
+                                   sweep.scenario_seeds(scenarios, 5)):
+            for direct, day in ETL_SIM.run_corridor(m, n, c, seed).items():
+                serial += day[0]
+                days[(m, n, c, direct)] = (day[1], day[2])
+    finally:
+        (ETL_SIM.time_range, ETL_SIM.frame_mode, ETL_SIM.record_metrics) = saved
+    assert scenarios == [(0, 0, 0), (0, 1, 0)]
+    assert time_vs_money.sum() > 0
+    assert (time_vs_money == serial).all()
+    assert list(speeds) == [(0, 0, 0, 'north'), (0, 0, 0, 'south'), \
+                            (0, 1, 0, 'north'), (0, 1, 0, 'south')]
+    assert speeds == days
+
+if __name__ == "__main__":
+    test_matches_serial()
+    print("Sweep tests passed")
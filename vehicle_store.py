@@ -0,0 +1,424 @@
+#=======================================================================
+#                        General Documentation
+#
+    # Struct-of-arrays vehicle store for I-405 Simulation
+#
+#-----------------------Additional Documentation------------------------
+
+# Modification History:
+# - 17 October 2026: vehicle_store.py created
+
+# Notes:
+# - Developed for Python 3.x
+# - Alternative to keeping a list of Car and Bus objects. Every vehicle
+#   attribute lives in a NumPy array indexed by vehicle slot, and a
+#   whole time step is advanced with a few array passes per lane.
+# - Rows are the head of the vehicle, which covers the rows
+#   head - length + 1 through head of its lane in highway.occupancy.
+#   Cars are 2 rows long, buses are 3.
+
+#=======================================================================
+
+import numpy
+
+import etl_decision
+
+CAR_LENGTH = 2
+BUS_LENGTH = 3
+
+class VehicleStore:
+    def __init__(self, highway, max_forward_moves=10, near_etl_length=5, \
+                 near_exit_length=5, capacity=256, decide=None):
+        """ Construct an empty VehicleStore
+
+        Method Arguments:
+            - highway : the Highway the vehicles drive on
+            - max_forward_moves : maximum number of squares a car moves per step
+            - near_etl_length : squares before an ETL entry where cars merge left
+            - near_exit_length : squares before an exit where vehicles merge right
+            - capacity : initial number of vehicle slots, grows as needed
+            - decide : callable(store, idx, timestep) returning a bool array
+              of which of the vehicles idx want the ETL, defaults to the
+              batched want_to_move_to_ETL rules in etl_decision.py
+
+        Member Variables:
+            - count : number of vehicles currently on the road
+            - x, y : lane column and head row of every vehicle
+            - length : number of rows the vehicle covers
+            - max_moves : maximum squares the vehicle moves per step
+            - on_etl, going_to_etl : lane state of every vehicle
+            - exit_y : row at which the vehicle wants to leave
+            - exit_idx : index of the exit object in highway.exits_arr
+            - is_bus, north, income, pop, has_gtg, freq_commuter,
+              in_a_hurry : behavioural attributes of the driver
+            - decision_key, wants_etl : last ETL decision of every
+              vehicle and the bucket it was made in (-1 for none yet),
+              see etl_decision.StoreDecider
+            - waiting : vehicles that could not be placed on the road yet
+        """
+        self.highway = highway
+        self.max_forward_moves = max_forward_moves
+        self.near_etl_length = near_etl_length
+        self.near_exit_length = near_exit_length
+        self.count = 0
+        self.next_id = 0
+        self.waiting = []
+        self.decide = decide if decide is not None else \
+                      etl_decision.store_decider()
+        self._allocate(capacity)
+
+    def __len__(self):
+        """
+        Number of vehicles on the road or waiting to enter it
+        """
+        return self.count + len(self.waiting)
+
+    def _allocate(self, capacity):
+        """
+        Create (or grow) every per-vehicle array
+
+        Method Arguments:
+            - capacity : number of vehicle slots to hold
+        """
+        fields = {'id': numpy.int64, 'x': numpy.int32, 'y': numpy.int32, \
+                  'length': numpy.int32, 'max_moves': numpy.int32, \
+                  'on_etl': bool, 'going_to_etl': bool, \
+                  'exit_y': numpy.int32, 'exit_idx': numpy.int32, \
+                  'is_bus': bool, 'north': bool, 'income': numpy.float64, \
+                  'pop': numpy.int32, 'has_gtg': bool, \
+                  'freq_commuter': bool, 'in_a_hurry': bool, \
+                  'decision_key': numpy.int32, 'wants_etl': bool}
+        for name, dtype in fields.items():
+            arr = numpy.zeros(capacity, dtype=dtype)
+            if hasattr(self, name):
+                arr[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, arr)
+        self.capacity = capacity
+        self._fields = list(fields)
+
+    def add(self, x, y, exit_y, exit_idx=-1, is_bus=False, north=True, \
+            income=60000.0, pop=1, has_gtg=False, freq_commuter=False, \
+            in_a_hurry=False, max_moves=None):
+        """
+        Queue a vehicle to be placed on the road
+
+        The vehicle is written to the grid at the start of the next step
+        once the rows it covers are free.
+
+        Method Arguments:
+            - x : lane column the vehicle enters on
+            - y : head row the vehicle enters at
+            - exit_y : row at which the vehicle wants to leave
+            - exit_idx : index of its exit in highway.exits_arr
+            - is_bus : bool representing if the vehicle is a bus
+            - remaining arguments : driver attributes, see Car
+
+        Returns:
+            - the id given to the vehicle
+        """
+        if max_moves is None:
+            max_moves = self.max_forward_moves
+        length = BUS_LENGTH if is_bus else CAR_LENGTH
+        # the vehicle has to fit on the road behind its head
+        y = max(int(y), length - 1)
+        vid = self.next_id
+        self.next_id += 1
+        self.waiting.append((vid, int(x), y, length, int(max_moves), \
+                             int(exit_y), int(exit_idx), bool(is_bus), \
+                             bool(north), float(income), int(pop), \
+                             bool(has_gtg), bool(freq_commuter), \
+                             bool(in_a_hurry)))
+        return vid
+
+    def add_vehicle(self, veh):
+        """
+        Queue an existing Car or Bus object
+
+        Method Arguments:
+            - veh : Car or Bus to copy the attributes of
+
+        Returns:
+            - the id given to the vehicle
+        """
+        hw = self.highway
+        if hasattr(veh, 'direction'):
+            exit_idx = hw.exit_position(veh.exit) if veh.exit is not None \
+                       else -1
+            return self.add(veh.x, veh.y, veh.exit_coord[0], exit_idx, \
+                            north=veh.direction == 'North', \
+                            income=veh.income, pop=veh.pop, \
+                            has_gtg=veh.has_gtg, \
+                            freq_commuter=veh.freq_commuter, \
+                            in_a_hurry=veh.in_a_hurry, \
+                            max_moves=veh.max_forward_moves)
+        # buses are centred on y, so their head is one row further on
+        ramp = hw.next_exit(veh.y)
+        return self.add(veh.x, veh.y + 1, ramp.y, hw.exit_position(ramp), \
+                        is_bus=True, max_moves=veh.max)
+
+    def _place_waiting(self):
+        """
+        Move waiting vehicles onto the road where there is room
+        """
+        occ = self.highway.occupancy
+        still_waiting = []
+        for rec in self.waiting:
+            vid, x, y, length = rec[:4]
+            if numpy.any(occ[x, y - length + 1:y + 1] != 0):
+                still_waiting.append(rec)
+                continue
+            if self.count == self.capacity:
+                self._allocate(2 * self.capacity)
+            i = self.count
+            for name, value in zip(['id', 'x', 'y', 'length', 'max_moves', \
+                                    'exit_y', 'exit_idx', 'is_bus', 'north', \
+                                    'income', 'pop', 'has_gtg', \
+                                    'freq_commuter', 'in_a_hurry'], rec):
+                getattr(self, name)[i] = value
+            self.on_etl[i] = self.highway.terrain[x, y] == 1
+            self.going_to_etl[i] = False
+            self.decision_key[i] = -1
+            occ[x, y - length + 1:y + 1] = 1
+            self.highway.squares_changed(x, length)
+            self.highway.vehicle_entered(x - 1)
+            self.count += 1
+        self.waiting = still_waiting
+
+    def _footprint(self, idx):
+        """
+        Grid rows and columns covered by a set of vehicles
+
+        Method Arguments:
+            - idx : array of vehicle slots
+
+        Returns:
+            - (rows, cols) arrays usable for fancy indexing
+        """
+        x = self.x[idx]
+        y = self.y[idx]
+        length = self.length[idx]
+        rows = []
+        cols = []
+        for k in range(BUS_LENGTH):
+            part = k < length
+            rows.append(y[part] - k)
+            cols.append(x[part])
+        return numpy.concatenate(rows), numpy.concatenate(cols)
+
+    def _shift(self, idx, direction):
+        """
+        Shift vehicles one lane left or right where the rows are clear
+
+        Vehicles leaving the same lane never overlap, and vehicles from
+        different lanes shifting the same way land in different lanes, so
+        every candidate can be checked against the grid in one pass.
+
+        Method Arguments:
+            - idx : candidate vehicle slots
+            - direction : -1 for left, 1 for right
+
+        Returns:
+            - array of the slots that shifted
+        """
+        if len(idx) == 0:
+            return idx
+        occ = self.highway.occupancy
+        terrain = self.highway.terrain
+        target = self.x[idx] + direction
+        ok = numpy.ones(len(idx), dtype=bool)
+        for k in range(BUS_LENGTH):
+            part = k < self.length[idx]
+            rows = numpy.maximum(self.y[idx] - k, 0)
+            ok &= ~part | (occ[target, rows] == 0)
+            # never drive onto the barriers
+            ok &= ~part | (terrain[target, rows] != 2)
+        idx = idx[ok]
+        if len(idx) == 0:
+            return idx
+        rows, cols = self._footprint(idx)
+        occ[cols, rows] = 0
+        self.highway.squares_changed(cols, -1)
+        self.highway.vehicle_shifted(self.x[idx] - 1, self.x[idx] - 1 + direction)
+        self.x[idx] += direction
+        rows, cols = self._footprint(idx)
+        occ[cols, rows] = 1
+        self.highway.squares_changed(cols, 1)
+        return idx
+
+    def _next_occupied(self, occ, idx, cols):
+        """
+        First occupied row ahead of a set of vehicles
+
+        Method Arguments:
+            - occ : occupancy plane, indexed [column, row]
+            - idx : vehicle slots
+            - cols : lane column to look in for each vehicle
+
+        Returns:
+            - array of rows, the grid length where the lane is clear
+        """
+        rows = numpy.shape(occ)[1]
+        marks = numpy.where(occ != 0, numpy.arange(rows), rows)
+        # running minimum from the far end gives the next occupied row
+        ahead = numpy.minimum.accumulate(marks[:, ::-1], axis=1)[:, ::-1]
+        ahead = numpy.hstack([ahead, numpy.full((numpy.shape(occ)[0], 1), rows)])
+        return ahead[cols, numpy.minimum(self.y[idx] + 1, rows)]
+
+    def _gap(self, occ, idx, cols):
+        """
+        Squares a vehicle could move forward in a lane keeping one clear
+        square in front, matching Car.get_max_forward
+        """
+        return numpy.maximum(self._next_occupied(occ, idx, cols) - \
+                             self.y[idx] - 2, 0)
+
+    def _near_etl_entry(self, idx):
+        """
+        Which vehicles are within near_etl_length before an ETL entry
+
+        A highway without listed entries lets cars merge anywhere.
+        """
+        entries = self.highway.etl_entry_arr
+        if len(entries) == 0:
+            return numpy.ones(len(idx), dtype=bool)
+        entry_y = numpy.sort(numpy.array([e[0] for e in entries]))
+        pos = numpy.searchsorted(entry_y, self.y[idx])
+        nxt = numpy.append(entry_y, numpy.iinfo(numpy.int32).max)[pos]
+        return nxt - self.y[idx] <= self.near_etl_length
+
+    def step(self, timestep, decide=None):
+        """
+        Advance every vehicle by one time step
+
+        Method Arguments:
+            - timestep : the time step in the sequence
+            - decide : optional decision callable used for this step
+              instead of the store's own
+
+        Returns:
+            - array of squares moved per lane (index 0 is the leftmost lane)
+            - list of ids of the vehicles that left the highway
+        """
+        hw = self.highway
+        self._place_waiting()
+        moved = numpy.zeros(hw.num_lns)
+        if hw.moved is not None:
+            hw.clear_moves()
+        n = self.count
+        if n == 0:
+            return moved, []
+        occ = hw.occupancy
+        terrain = hw.terrain
+        rows = numpy.shape(occ)[1]
+        idx = numpy.arange(n)
+        gpl_col = hw.num_etl_lns + 1
+        exit_col = hw.num_lns
+        near_exit = (self.exit_y[:n] - self.y[:n] <= self.near_exit_length) | \
+                    (self.y[:n] + 0.5 * hw.grid_per_mile >= rows)
+        # ETL decisions for cars in the GPL that could still merge
+        ask = idx[~self.on_etl[:n] & ~self.is_bus[:n] & ~near_exit]
+        ask = ask[self._near_etl_entry(ask)]
+        if decide is None:
+            decide = self.decide
+        if len(ask) > 0:
+            self.going_to_etl[ask] = decide(self, ask, timestep)
+        self.going_to_etl[:n] &= ~near_exit & ~self.on_etl[:n]
+        # lane changes, decided from the grid at the start of the step
+        direction = numpy.zeros(n, dtype=numpy.int32)
+        direction[near_exit & (self.x[:n] < exit_col)] = 1
+        merge = self.going_to_etl[:n]
+        direction[merge & (self.x[:n] > gpl_col)] = -1
+        # cars at the left edge of the GPL cross into the ETL
+        direction[merge & (self.x[:n] == gpl_col)] = -1
+        free = idx[(direction == 0) & ~self.on_etl[:n] & ~near_exit & ~merge]
+        if len(free) > 0:
+            fwd = self._gap(occ, free, self.x[free])
+            left = numpy.zeros(len(free), dtype=fwd.dtype)
+            right = numpy.zeros(len(free), dtype=fwd.dtype)
+            can_left = self.x[free] - 1 >= gpl_col
+            can_right = self.x[free] + 1 <= exit_col
+            left[can_left] = self._gap(occ, free[can_left], \
+                                       self.x[free[can_left]] - 1)
+            right[can_right] = self._gap(occ, free[can_right], \
+                                         self.x[free[can_right]] + 1)
+            go_right = (fwd < right) & (right >= left)
+            go_left = (fwd < left) & (left > right)
+            direction[free[go_right]] = 1
+            direction[free[go_left]] = -1
+        self._shift(idx[direction == 1], 1)
+        shifted_left = self._shift(idx[direction == -1], -1)
+        entered = shifted_left[terrain[self.x[shifted_left], \
+                                       self.y[shifted_left]] == 1]
+        self.on_etl[entered] = True
+        self.going_to_etl[entered] = False
+        # forward moves, one lane at a time from the front vehicle back
+        cap = self.y[:n] + self.max_moves[:n]
+        stop = near_exit & (self.exit_y[:n] > self.y[:n])
+        cap[stop] = numpy.minimum(cap[stop], self.exit_y[:n][stop])
+        rr, cc = self._footprint(idx)
+        occ[cc, rr] = 0
+        # anything left on the grid does not belong to the store
+        limit = numpy.minimum(self._next_occupied(occ, idx, self.x[:n]), \
+                              rows) - 2
+        new_y = self.y[:n].copy()
+        for col in range(1, hw.num_lns + 1):
+            lane = idx[self.x[:n] == col]
+            if len(lane) == 0:
+                continue
+            lane = lane[numpy.argsort(-self.y[lane], kind='stable')]
+            best = numpy.minimum(cap[lane], limit[lane])
+            spacing = numpy.zeros(len(lane), dtype=numpy.int64)
+            spacing[1:] = self.length[lane[:-1]] + 1
+            offset = numpy.cumsum(spacing)
+            ahead = numpy.minimum.accumulate(best + offset) - offset
+            new_y[lane] = numpy.maximum(ahead, self.y[lane])
+            moved[col - 1] += numpy.sum(new_y[lane] - self.y[lane])
+        if hw.moved is not None:
+            hw.record_moves(self.x[:n], new_y, new_y - self.y[:n])
+        self.y[:n] = new_y
+        rr, cc = self._footprint(idx)
+        # vehicles keep their lane moving forward, so does every square count
+        occ[cc, rr] = 1
+        self.on_etl[:n] = terrain[self.x[:n], self.y[:n]] == 1
+        # vehicles at their exit or the end of the road leave
+        leaving = ((self.y[:n] >= self.exit_y[:n]) & (self.x[:n] == exit_col)) | \
+                  (self.y[:n] + hw.grid_per_mile >= rows)
+        gone = self._release(idx[leaving])
+        # the grid was written in bulk, so the gap index is rebuilt lazily
+        hw.occupancy_changed()
+        return moved, gone
+
+    def _release(self, idx):
+        """
+        Hand leaving vehicles to their exit and remove them from the road
+
+        Vehicles stay on the road while their exit is full.
+
+        Method Arguments:
+            - idx : slots of the vehicles trying to leave
+
+        Returns:
+            - list of ids of the vehicles that left
+        """
+        exits = self.highway.exits_arr
+        gone = []
+        for i in idx:
+            ramp = exits[self.exit_idx[i]]
+            if ramp.intake(int(self.id[i])):
+                gone.append(i)
+        gone = numpy.array(gone, dtype=numpy.int64)
+        if len(gone) == 0:
+            return []
+        rows, cols = self._footprint(gone)
+        self.highway.occupancy[cols, rows] = 0
+        self.highway.squares_changed(cols, -1)
+        self.highway.vehicle_exited(self.x[gone] - 1)
+        ids = [int(v) for v in self.id[gone]]
+        keep = numpy.ones(self.count, dtype=bool)
+        keep[gone] = False
+        n = int(numpy.sum(keep))
+        for name in self._fields:
+            arr = getattr(self, name)
+            arr[:n] = arr[:self.count][keep]
+        self.count = n
+        return ids
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#=======================================================================
+#                        General Documentation
+""" Testing suite for the VehicleStore.
+
+    Checks the array engine keeps the grid, the lane counts and its
+    per-vehicle arrays consistent.
+"""
+#-----------------------------------------------------------------------
+#                       Additional Documentation
+#
+# Notes:
+# - Written for Python 3.x
+# - Part of larger I-405 Simulation
+#=======================================================================
+
+import numpy
+
+from fixtures import make_highway
+from vehicle_store import VehicleStore
+
+def never(store, idx, timestep):
+    """ Decision callback keeping every car out of the ETL
+
+    """
+    return numpy.zeros(len(idx), dtype=bool)
+
+def test_place_vehicles():
+    """ Placed vehicles mark the squares behind their head and are
+        counted in their lane, blocked ones keep waiting
+
+    """
+    hw = make_highway()
+    store = VehicleStore(hw)
+    store.add(2, 10, 100)
+    store.add(3, 20, 100, is_bus=True)
+    store.add(2, 10, 100)
+    store._place_waiting()
+    assert store.count == 2 and len(store.waiting) == 1
+    assert list(numpy.nonzero(hw.occupancy[2])[0]) == [9, 10]
+    assert list(numpy.nonzero(hw.occupancy[3])[0]) == [18, 19, 20]
+    assert hw.occupancy.sum() == 5
+    assert list(hw.get_lane_counts()) == [0, 1, 1]
+    assert list(hw.lane_squares) == [0, 2, 3]
+    assert list(store.length[:2]) == [2, 3]
+    assert (store.decision_key[:2] == -1).all()
+
+def test_step_keeps_gaps():
+    """ Stepping never puts two vehicles on one square nor moves one
+        past the next occupied square
+
+    """
+    hw = make_highway()
+    store = VehicleStore(hw, decide=never)
+    rng = numpy.random.default_rng(0)
+    for y in rng.choice(numpy.arange(2, 50), 20, replace=False):
+        store.add(2 + y % 2, y, 100, is_bus=bool(y % 5 == 0))
+    # a wall across every lane the store does not own
+    hw.occupancy[1:4, 60] = 1
+    for t in range(30):
+        store.step(t)
+        idx = numpy.arange(store.count)
+        rows, cols = store._footprint(idx)
+        squares = set(zip(cols.tolist(), rows.tolist()))
+        assert len(squares) == len(rows)
+        assert (hw.occupancy[cols, rows] == 1).all()
+        assert hw.occupancy.sum() == len(rows) + 3
+        assert (store.y[idx] <= 58).all()
+        assert list(hw.get_lane_counts()) == \
+               [int(numpy.sum(store.x[idx] == col)) for col in (1, 2, 3)]
+        # the wall was written past the counters
+        assert (hw.lane_squares == hw.occupancy[1:-1].sum(axis=1) - 1).all()
+
+def test_release():
+    """ Leaving vehicles wait while their exit is full, and every field
+        is compacted once one leaves
+
+    """
+    hw = make_highway()
+    store = VehicleStore(hw)
+    for y in (10, 20, 30):
+        store.add(3, y, 50, exit_idx=0, income=1000.0 * y)
+    store._place_waiting()
+    store.decision_key[:3] = [10, 11, 12]
+    store.wants_etl[:3] = [True, False, True]
+    ramp = hw.exits_arr[0]
+    for vid in range(ramp.max):
+        ramp.intake(vid)
+    assert store._release(numpy.array([1])) == []
+    assert store.count == 3 and ramp.count == ramp.max
+    hw.ramps.step(0)
+    leaving = int(store.id[1])
+    assert store._release(numpy.array([1])) == [leaving]
+    assert store.count == 2
+    assert list(store.id[:2]) == [0, 2]
+    assert list(store.y[:2]) == [10, 30]
+    assert list(store.income[:2]) == [10000.0, 30000.0]
+    assert list(store.decision_key[:2]) == [10, 12]
+    assert list(store.wants_etl[:2]) == [True, True]
+    assert list(numpy.nonzero(hw.occupancy[3])[0]) == [9, 10, 29, 30]
+    assert list(hw.get_lane_counts()) == [0, 0, 2]
+    assert list(hw.lane_squares) == [0, 0, 4]
+    assert list(hw.ramps.waiting(ramp.index)) == [leaving]
+
+def test_seeded_day():
+    """ A short seeded day runs to the end with the array engine
+
+    """
+    import ETL_SIM
+    saved = (ETL_SIM.vehicle_engine, ETL_SIM.time_range, ETL_SIM.frame_mode, \
+             ETL_SIM.record_metrics)
+    ETL_SIM.vehicle_engine = 'arrays'
+    ETL_SIM.time_range = 120
+    ETL_SIM.frame_mode = 'none'
+    ETL_SIM.record_metrics = False
+    try:
+        money, speed_g, speed_e = ETL_SIM.run_direction('north', 2, 5, 3)
+        again = ETL_SIM.run_direction('north', 2, 5, 3)
+    finally:
+        (ETL_SIM.vehicle_engine, ETL_SIM.time_range, ETL_SIM.frame_mode, \
+         ETL_SIM.record_metrics) = saved
+    assert len(speed_g) == len(speed_e) == 2 * 120
+    assert money.sum() > 0
+    assert (again[0] == money).all() and again[1] == speed_g
+
+if __name__ == "__main__":
+    test_place_vehicles()
+    test_step_keeps_gaps()
+    test_release()
+    test_seeded_day()
+    print("VehicleStore tests passed")